@@ -1,18 +1,43 @@
 import numpy as np
-from fastapi import APIRouter
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, HTTPException, Request, status
 
-from app.services.markowitz import markowitz_optimization
+from app.services.markowitz import COVARIANCE_METHODS, markowitz_optimization
 
 router = APIRouter()
 
 
-class ReturnsPayload(BaseModel):
-    returns: list  # list of lists shape (n_obs, n_assets)
+@router.post("/markowitz")
+async def run_markowitz(request: Request):
+    # Body is {"returns": [[...], ...], "covariance_method": "sample"|"ledoit_wolf"}
+    # with returns shaped (n_obs, n_assets) and covariance_method optional
+    # (defaults to "sample"; send "ledoit_wolf" for shrinkage). Parsed
+    # with orjson straight into a float64 array to skip per-element validation
+    try:
+        payload = orjson.loads(await request.body())
+        arr = np.asarray(payload["returns"], dtype=np.float64)
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid returns payload: {e}",
+        )
 
+    # A covariance needs at least two observations of at least one asset
+    if arr.ndim != 2 or arr.shape[0] < 2 or arr.shape[1] < 1:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                "returns must be a list of lists shaped (n_obs, n_assets) "
+                "with n_obs >= 2 and n_assets >= 1"
+            ),
+        )
 
-@router.post("/markowitz")
-def run_markowitz(payload: ReturnsPayload):
-    arr = np.array(payload.returns, dtype=float)
-    res = markowitz_optimization(arr)
+    covariance_method = payload.get("covariance_method", "sample")
+    if covariance_method not in COVARIANCE_METHODS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"covariance_method must be one of {list(COVARIANCE_METHODS)}",
+        )
+
+    res = markowitz_optimization(arr, covariance_method=covariance_method)
     return res
@@ -14,14 +14,19 @@ def run_montecarlo(
     T: float = 1.0,
     steps: int = 252,
     sims: int = 1000,
+    antithetic: bool = False,
 ):
-    sims_arr = monte_carlo_simulation(S0, mu, sigma, T, steps, sims)
-    # return summary instead of full array to keep payload small
-    final = sims_arr[-1]
+    final = monte_carlo_simulation(
+        S0, mu, sigma, T, steps, sims, return_paths=False, antithetic=antithetic
+    )
+    # one O(n) partition places all three quantiles instead of a sort per percentile
+    last = final.shape[0] - 1
+    k5, k50, k95 = int(0.05 * last), int(0.5 * last), int(0.95 * last)
+    final = np.partition(final, (k5, k50, k95))
     return {
         "final_mean": float(final.mean()),
         "final_std": float(final.std()),
-        "p5": float(np.percentile(final, 5)),
-        "p50": float(np.percentile(final, 50)),
-        "p95": float(np.percentile(final, 95)),
+        "p5": float(final[k5]),
+        "p50": float(final[k50]),
+        "p95": float(final[k95]),
     }
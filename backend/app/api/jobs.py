@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import uuid
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from ..auth import get_current_active_user
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from ..models import Job, User
 from ..pubsub import get_pubsub_publisher
 from ..schemas import (
@@ -15,15 +19,20 @@ from ..schemas import (
     JobCreateResponse,
     JobListResponse,
     JobStatusResponse,
+    JobSummary,
     JobType,
 )
 
 router = APIRouter(prefix="/v1/jobs", tags=["jobs"])
 
+# Stored job type string -> enum, avoids an Enum value lookup per row
+_JOBTYPE_BY_VALUE = {jt.value: jt for jt in JobType}
+
 
 @router.post("/", response_model=JobCreateResponse)
 async def create_job(
     job_request: CreateJobRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -31,11 +40,13 @@ async def create_job(
     Create a new async job.
 
     This endpoint validates the job request, creates a job record in the database,
-    and publishes a message to Pub/Sub for the worker to process.
+    and publishes a message to Pub/Sub for the worker to process. Publishing runs
+    as a background task after the response is sent.
     """
     try:
-        # Create job in database
-        job = Job.create_job(
+        # Create job in database (sync ORM call kept off the event loop)
+        job = await run_in_threadpool(
+            Job.create_job,
             db=db,
             user_id=current_user.id,
             job_type=job_request.type.value,
@@ -46,14 +57,13 @@ async def create_job(
             vendor=job_request.vendor.value if job_request.vendor else "eodhd",
             adjusted=job_request.adjusted,
             params=(
-                job_request.params.dict()
-                if hasattr(job_request.params, "dict")
+                job_request.params.model_dump(mode="json")
+                if isinstance(job_request.params, BaseModel)
                 else job_request.params
             ),
         )
 
-        # Publish to Pub/Sub
-        pubsub = get_pubsub_publisher()
+        # Publish to Pub/Sub once the response has been sent
         message_data = {
             "job_id": str(job.id),
             "user_id": str(job.user_id),
@@ -67,7 +77,7 @@ async def create_job(
             "params": job.params_json,
         }
 
-        pubsub.publish_job(message_data)
+        background_tasks.add_task(_publish_job_message, job.id, message_data)
 
         # Estimate duration based on job type
         estimated_duration = _estimate_job_duration(
@@ -83,7 +93,7 @@ async def create_job(
 
     except Exception as e:
         # Rollback database transaction
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create job: {str(e)}",
@@ -92,7 +102,7 @@ async def create_job(
 
 @router.get("/{job_id}", response_model=JobStatusResponse)
 async def get_job(
-    job_id: str,
+    job_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -102,14 +112,7 @@ async def get_job(
     Returns job information including current status, metrics, and signed URLs
     to results stored in Google Cloud Storage.
     """
-    try:
-        job_uuid = uuid.UUID(job_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid job ID format"
-        )
-
-    job = Job.get_job(db, job_uuid)
+    job = await run_in_threadpool(Job.get_job, db, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
@@ -125,11 +128,11 @@ async def get_job(
     return JobStatusResponse(
         job_id=job.id,
         user_id=job.user_id,
-        type=JobType(job.type),
+        type=_JOBTYPE_BY_VALUE[job.type],
         status=job.status,
         symbols=job.symbols,
-        start=job.start_ts.strftime("%Y-%m-%d") if job.start_ts else "",
-        end=job.end_ts.strftime("%Y-%m-%d") if job.end_ts else "",
+        start=job.start_ts.isoformat()[:10] if job.start_ts else "",
+        end=job.end_ts.isoformat()[:10] if job.end_ts else "",
         interval=job.interval,
         vendor=job.vendor,
         adjusted=job.adjusted,
@@ -156,41 +159,35 @@ async def list_jobs(
     """
     List user's jobs with pagination and filtering.
     """
-    # Get jobs for current user
-    jobs, total = Job.get_user_jobs(db, current_user.id, page, size)
-
-    # Apply filters if provided
-    if job_type or status_filter:
-        filtered_jobs = []
-        for job in jobs:
-            if job_type and job.type != job_type.value:
-                continue
-            if status_filter and job.status != status_filter:
-                continue
-            filtered_jobs.append(job)
-        jobs = filtered_jobs
+    # Get jobs for current user, filtered in SQL so pagination and total agree
+    jobs, total = await run_in_threadpool(
+        Job.get_user_jobs_light,
+        db,
+        current_user.id,
+        page,
+        size,
+        job_type=job_type.value if job_type else None,
+        status=status_filter,
+    )
 
     # Convert to response schema
     job_responses = []
     for job in jobs:
         job_responses.append(
-            JobStatusResponse(
+            JobSummary(
                 job_id=job.id,
                 user_id=job.user_id,
-                type=JobType(job.type),
+                type=_JOBTYPE_BY_VALUE[job.type],
                 status=job.status,
                 symbols=job.symbols,
-                start=job.start_ts.strftime("%Y-%m-%d") if job.start_ts else "",
-                end=job.end_ts.strftime("%Y-%m-%d") if job.end_ts else "",
+                start=job.start_ts.isoformat()[:10] if job.start_ts else "",
+                end=job.end_ts.isoformat()[:10] if job.end_ts else "",
                 interval=job.interval,
                 vendor=job.vendor,
                 adjusted=job.adjusted,
-                params=job.params_json,
                 created_at=job.created_at,
                 started_at=job.started_at,
                 finished_at=job.finished_at,
-                metrics=job.result_refs.get("metrics") if job.result_refs else None,
-                result_urls=job.result_refs.get("urls") if job.result_refs else None,
                 error=job.error,
                 progress=_calculate_job_progress(job),
             )
@@ -207,7 +204,7 @@ async def list_jobs(
 
 @router.delete("/{job_id}")
 async def cancel_job(
-    job_id: str,
+    job_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -216,14 +213,7 @@ async def cancel_job(
 
     Only queued jobs can be cancelled. Running or completed jobs cannot be cancelled.
     """
-    try:
-        job_uuid = uuid.UUID(job_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid job ID format"
-        )
-
-    job = Job.get_job(db, job_uuid)
+    job = await run_in_threadpool(Job.get_job, db, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
@@ -243,28 +233,46 @@ async def cancel_job(
         )
 
     # Update job status to cancelled
-    job.update_status(db, "cancelled")
+    await run_in_threadpool(job.update_status, db, "cancelled")
 
     return {"message": "Job cancelled successfully"}
 
 
+def _publish_job_message(job_id: uuid.UUID, message_data: Dict[str, Any]) -> None:
+    """Publish a job message, marking the job failed if publishing gives up."""
+    try:
+        get_pubsub_publisher().publish_job_sync(message_data)
+    except Exception as e:
+        # The request session is closed by now, so record the failure in a new one
+        db = SessionLocal()
+        try:
+            job = Job.get_job(db, job_id)
+            if job:
+                job.set_error(db, f"Failed to publish job: {str(e)}")
+        finally:
+            db.close()
+
+
+# Base duration in seconds per job type
+_BASE_DURATION = {
+    JobType.MONTE_CARLO: 30,
+    JobType.MARKOWITZ: 15,
+    JobType.BLACK_SCHOLES: 10,
+    JobType.BACKTEST: 45,
+}
+
+
+@lru_cache(maxsize=None)
 def _estimate_job_duration(job_type: JobType, num_symbols: int) -> int:
     """Estimate job duration in seconds."""
-    base_duration = {
-        JobType.MONTE_CARLO: 30,
-        JobType.MARKOWITZ: 15,
-        JobType.BLACK_SCHOLES: 10,
-        JobType.BACKTEST: 45,
-    }
-
-    base = base_duration.get(job_type, 30)
+    base = _BASE_DURATION.get(job_type, 30)
     # Add time for data loading and processing
     symbol_factor = min(num_symbols * 2, 60)  # Cap at 60 seconds
 
     return base + symbol_factor
 
 
-def _calculate_job_progress(job: Job) -> Optional[float]:
+def _calculate_job_progress(job: Union[Job, Row]) -> Optional[float]:
     """Calculate job progress as a float between 0.0 and 1.0."""
     if job.status == "queued":
         return 0.0
@@ -273,7 +281,7 @@ def _calculate_job_progress(job: Job) -> Optional[float]:
             # Estimate progress based on time elapsed
             elapsed = (job.started_at - job.created_at).total_seconds()
             estimated_duration = _estimate_job_duration(
-                JobType(job.type), len(job.symbols)
+                _JOBTYPE_BY_VALUE[job.type], len(job.symbols)
             )
             return min(0.9, elapsed / estimated_duration)
         return 0.5
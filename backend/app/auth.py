@@ -7,7 +7,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
 
-from .database import get_db_session
+from .database import get_db
 from .models import User
 
 # Security scheme for JWT tokens
@@ -15,7 +15,7 @@ security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
-    token: Optional[str] = Depends(security), db: Session = Depends(get_db_session)
+    token: Optional[str] = Depends(security), db: Session = Depends(get_db)
 ) -> User:
     """
     Get current authenticated user.
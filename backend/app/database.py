@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import logging
 import os
-from typing import Generator
+import time
+from typing import Generator, Optional, Tuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from .models import Base
 
+logger = logging.getLogger(__name__)
+
 # Database configuration
 DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "5432")
@@ -35,7 +39,7 @@ else:
         )
     except ImportError:
         # Fallback to SQLite if psycopg2 is not available
-        print("Warning: psycopg2 not available, using SQLite for local development")
+        logger.warning("psycopg2 not available, using SQLite for local development")
         DB_URL = "sqlite:///./quant_finance.db"
 
 # Create engine
@@ -44,8 +48,18 @@ if "sqlite" in DB_URL:
         DB_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
-        echo=True,  # Enable SQL logging for debugging
+        echo=os.getenv("SQL_ECHO", "false").lower() == "true",
     )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets readers proceed while a write is in flight."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 else:
     engine = create_engine(
         DB_URL,
@@ -71,19 +85,25 @@ def init_db() -> None:
     Base.metadata.create_all(bind=engine)
 
 
+# Health probes are polled frequently; reuse a recent result for this long
+DB_HEALTH_TTL_SECONDS = 5.0
+_db_health_cache: Optional[Tuple[float, bool]] = None
+
+
 def check_db_connection() -> bool:
     """Check if database connection is working."""
+    global _db_health_cache
+    now = time.monotonic()
+    if _db_health_cache and now - _db_health_cache[0] < DB_HEALTH_TTL_SECONDS:
+        return _db_health_cache[1]
+
     try:
-        db = SessionLocal()
-        db.execute("SELECT 1")
-        db.close()
-        return True
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        healthy = True
     except Exception as e:
-        print(f"Database connection check failed: {e}")
-        return False
-
+        logger.error(f"Database connection check failed: {e}")
+        healthy = False
 
-# Dependency for FastAPI
-def get_db_session() -> Session:
-    """Get database session for dependency injection."""
-    return SessionLocal()
+    _db_health_cache = (now, healthy)
+    return healthy
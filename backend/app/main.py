@@ -1,40 +1,46 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api import jobs
 from .database import check_db_connection, init_db
 from .pubsub import get_pubsub_publisher
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
-    print("Starting Quant Finance Platform API...")
+    logger.info("Starting Quant Finance Platform API...")
 
     # Initialize database
     try:
         init_db()
-        print("Database initialized successfully")
+        logger.info("Database initialized successfully")
     except Exception as e:
-        print(f"Warning: Database initialization failed: {e}")
+        logger.warning(f"Database initialization failed: {e}")
 
     # Check connections
     db_status = "connected" if check_db_connection() else "disconnected"
     pubsub_status = "connected" if get_pubsub_publisher().publisher else "disconnected"
 
-    print(f"Database: {db_status}")
-    print(f"Pub/Sub: {pubsub_status}")
+    logger.info(f"Database: {db_status}")
+    logger.info(f"Pub/Sub: {pubsub_status}")
 
     yield
 
     # Shutdown
-    print("Shutting down Quant Finance Platform API...")
+    logger.info("Shutting down Quant Finance Platform API...")
 
 
 # Create FastAPI app
@@ -43,15 +49,20 @@ app = FastAPI(
     description="Async financial modeling and analysis API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS configuration
-frontend_origin = os.getenv("FRONTEND_ORIGIN", "http://localhost:3000")
+# CORS configuration (FRONTEND_ORIGIN may list several comma-separated origins)
+frontend_origins = tuple(
+    origin.strip()
+    for origin in os.getenv("FRONTEND_ORIGIN", "http://localhost:3000").split(",")
+    if origin.strip()
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[frontend_origin],
+    allow_origins=frontend_origins,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_methods=frozenset(("GET", "POST", "PUT", "DELETE")),
     allow_headers=["*"],
 )
 
@@ -72,8 +83,13 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    db_status = "connected" if check_db_connection() else "disconnected"
-    pubsub_status = "connected" if get_pubsub_publisher().publisher else "disconnected"
+    # Probe DB and Pub/Sub concurrently, off the event loop
+    db_ok, pubsub_ok = await asyncio.gather(
+        asyncio.to_thread(check_db_connection),
+        asyncio.to_thread(lambda: get_pubsub_publisher().publisher is not None),
+    )
+    db_status = "connected" if db_ok else "disconnected"
+    pubsub_status = "connected" if pubsub_ok else "disconnected"
 
     return {
         "status": "ok",
@@ -4,10 +4,11 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Index, String, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query, Session, defer
 
 Base = declarative_base()
 
@@ -92,9 +93,9 @@ class Job(Base):
         params: Dict[str, Any],
     ) -> Job:
         """Create a new job."""
-        # Parse dates
-        start_ts = datetime.strptime(start_date, "%Y-%m-%d")
-        end_ts = datetime.strptime(end_date, "%Y-%m-%d")
+        # Parse dates (fromisoformat is a C fast path for YYYY-MM-DD)
+        start_ts = datetime.fromisoformat(start_date)
+        end_ts = datetime.fromisoformat(end_date)
 
         job = cls(
             user_id=user_id,
@@ -122,23 +123,90 @@ class Job(Base):
 
     @classmethod
     def get_user_jobs(
-        cls, db: Session, user_id: uuid.UUID, page: int = 1, size: int = 50
+        cls,
+        db: Session,
+        user_id: uuid.UUID,
+        page: int = 1,
+        size: int = 50,
+        job_type: Optional[str] = None,
+        status: Optional[str] = None,
     ) -> tuple[List[Job], int]:
-        """Get paginated jobs for a user."""
+        """Get paginated jobs for a user, optionally filtered by type and status."""
+        # List views never read the JSON payload columns, so skip loading them
+        query = db.query(cls).options(defer(cls.params_json), defer(cls.result_refs))
+        rows, total = cls._paginate_user_jobs(
+            query, user_id, page, size, job_type, status
+        )
+        return [row[0] for row in rows], total
+
+    @classmethod
+    def get_user_jobs_light(
+        cls,
+        db: Session,
+        user_id: uuid.UUID,
+        page: int = 1,
+        size: int = 50,
+        job_type: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> tuple[List[Row], int]:
+        """Like get_user_jobs, but returns column tuples instead of ORM objects.
+
+        Rows expose the summary columns by attribute name (id, type, status,
+        symbols, start_ts, ...), skipping identity-map and instrumentation cost.
+        """
+        query = db.query(
+            cls.id,
+            cls.user_id,
+            cls.type,
+            cls.status,
+            cls.symbols,
+            cls.start_ts,
+            cls.end_ts,
+            cls.interval,
+            cls.vendor,
+            cls.adjusted,
+            cls.created_at,
+            cls.started_at,
+            cls.finished_at,
+            cls.error,
+        )
+        return cls._paginate_user_jobs(query, user_id, page, size, job_type, status)
+
+    @classmethod
+    def _paginate_user_jobs(
+        cls,
+        query: Query,
+        user_id: uuid.UUID,
+        page: int,
+        size: int,
+        job_type: Optional[str],
+        status: Optional[str],
+    ) -> tuple[List[Row], int]:
+        """Filter, order and page a user's jobs, returning rows and the total."""
         offset = (page - 1) * size
 
-        jobs = (
-            db.query(cls)
-            .filter(cls.user_id == user_id)
+        query = query.filter(cls.user_id == user_id)
+        if job_type:
+            query = query.filter(cls.type == job_type)
+        if status:
+            query = query.filter(cls.status == status)
+
+        # Window count rides along with the page so total costs no extra query
+        rows = (
+            query.add_columns(func.count().over().label("total"))
             .order_by(cls.created_at.desc())
             .offset(offset)
             .limit(size)
             .all()
         )
 
-        total = db.query(cls).filter(cls.user_id == user_id).count()
+        if rows:
+            return rows, rows[0].total
+
+        # Past the last page there is no row to carry the count
+        total = query.count() if offset else 0
 
-        return jobs, total
+        return [], total
 
     @classmethod
     def get_pending_jobs(cls, db: Session, limit: int = 10) -> List[Job]:
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import atexit
 import json
+import logging
 import os
-from typing import Any, Dict
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
 
 try:
     from google.cloud import pubsub_v1
+    from google.cloud.pubsub_v1.types import (
+        BatchSettings,
+        LimitExceededBehavior,
+        PublisherOptions,
+        PublishFlowControl,
+    )
 
     PUBSUB_AVAILABLE = True
 except ImportError:
     PUBSUB_AVAILABLE = False
-    print("Warning: google-cloud-pubsub not available. Pub/Sub functionality disabled.")
+    logger.warning("google-cloud-pubsub not available. Pub/Sub functionality disabled.")
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _encode_message(job_data: Dict[str, Any]) -> bytes:
+    """Serialize a job message to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        # UUIDs and datetimes are handled natively; str() covers anything else
+        return orjson.dumps(job_data, default=str, option=orjson.OPT_NAIVE_UTC)
+    return json.dumps(job_data, default=str).encode("utf-8")
 
 
 class PubSubPublisher:
@@ -25,50 +52,96 @@ class PubSubPublisher:
         # Only initialize if we have the required environment variables
         if self.project_id and PUBSUB_AVAILABLE:
             try:
-                self.publisher = pubsub_v1.PublisherClient()
+                # Let the client batch messages; publish_job hands back the future
+                # instead of blocking on each server ack. Unordered publishing lets
+                # batches go out in parallel, and flow control blocks callers
+                # rather than buffering without bound when the backlog grows
+                self.publisher = pubsub_v1.PublisherClient(
+                    batch_settings=BatchSettings(
+                        max_messages=1000,
+                        max_bytes=1024 * 1024,
+                        max_latency=0.05,
+                    ),
+                    publisher_options=PublisherOptions(
+                        enable_message_ordering=False,
+                        flow_control=PublishFlowControl(
+                            message_limit=10000,
+                            byte_limit=10 * 1024 * 1024,
+                            limit_exceeded_behavior=LimitExceededBehavior.BLOCK,
+                        ),
+                    ),
+                )
                 self.topic_path = self.publisher.topic_path(
                     self.project_id, self.topic_id
                 )
-                print(f"Pub/Sub initialized for topic: {self.topic_path}")
+                logger.info(f"Pub/Sub initialized for topic: {self.topic_path}")
+                # Flush anything still buffered when the process exits
+                atexit.register(self.close)
             except Exception as e:
-                print(f"Warning: Failed to initialize Pub/Sub: {e}")
-                print("Pub/Sub functionality will be disabled")
+                logger.warning(
+                    f"Failed to initialize Pub/Sub, functionality disabled: {e}"
+                )
                 self.publisher = None
                 self.topic_path = None
         else:
             if not self.project_id:
-                print("Warning: GCP_PROJECT not set, Pub/Sub disabled")
+                logger.warning("GCP_PROJECT not set, Pub/Sub disabled")
             if not PUBSUB_AVAILABLE:
-                print("Warning: google-cloud-pubsub not available, Pub/Sub disabled")
+                logger.warning("google-cloud-pubsub not available, Pub/Sub disabled")
 
-    def publish_job(self, job_data: Dict[str, Any]) -> str:
+    def publish_job(self, job_data: Dict[str, Any]) -> Optional[Future]:
         """
-        Publish a job message to Pub/Sub.
+        Queue a job message for batched publishing to Pub/Sub.
 
         Args:
             job_data: Job data to publish
 
         Returns:
-            Message ID if successful, None if Pub/Sub unavailable
+            Future resolving to the message ID, None if Pub/Sub unavailable
         """
         if not self.publisher:
-            print(f"Warning: Pub/Sub not available. Would publish: {job_data}")
+            logger.warning(f"Pub/Sub not available. Would publish: {job_data}")
             return None
 
-        try:
-            # Convert job data to JSON string
-            message_data = json.dumps(job_data, default=str).encode("utf-8")
+        message_data = _encode_message(job_data)
+
+        return self.publisher.publish(self.topic_path, data=message_data)
 
-            # Publish message
-            future = self.publisher.publish(self.topic_path, data=message_data)
-            message_id = future.result()
+    def publish_job_sync(
+        self, job_data: Dict[str, Any], max_attempts: int = 3
+    ) -> Optional[str]:
+        """
+        Publish a job message and wait for the server to acknowledge it.
 
-            print(f"Published job message: {message_id}")
-            return message_id
+        Args:
+            job_data: Job data to publish
+            max_attempts: Publish attempts before giving up (exponential backoff)
+
+        Returns:
+            Message ID if successful, None if Pub/Sub unavailable
+        """
+        for attempt in range(max_attempts):
+            try:
+                future = self.publish_job(job_data)
+                if future is None:
+                    return None
+                message_id = future.result()
+
+                logger.debug("Published job message: %s", message_id)
+                return message_id
+
+            except Exception as e:
+                logger.error(
+                    f"Error publishing job message (attempt {attempt + 1}): {e}"
+                )
+                if attempt == max_attempts - 1:
+                    raise
+                time.sleep(0.5 * 2**attempt)
 
-        except Exception as e:
-            print(f"Error publishing job message: {e}")
-            raise
+    def close(self) -> None:
+        """Flush batched messages and stop the publisher."""
+        if self.publisher:
+            self.publisher.stop()
 
     def publish_job_created(self, job_id: str, job_type: str, **kwargs) -> str:
         """
@@ -89,7 +162,7 @@ class PubSubPublisher:
             **kwargs,
         }
 
-        return self.publish_job(message_data)
+        return self.publish_job_sync(message_data)
 
 
 # Global publisher instance - initialize lazily
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+_SYMBOL_RE = re.compile(r"^[A-Za-z0-9./\-]{1,20}$")
 
 
 class JobType(str, Enum):
@@ -52,6 +55,8 @@ class DataVendor(str, Enum):
 class MonteCarloParams(BaseModel):
     """Monte Carlo simulation parameters."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     simulations: int = Field(
         10000, ge=1000, le=100000, description="Number of simulations"
     )
@@ -62,11 +67,22 @@ class MonteCarloParams(BaseModel):
     confidence_level: float = Field(
         0.95, ge=0.8, le=0.99, description="Confidence level for VaR"
     )
+    seed: int = Field(42, ge=0, description="Random seed for reproducible paths")
+    rng_method: str = Field(
+        "pseudo",
+        pattern="^(pseudo|antithetic|sobol)$",
+        description="Shock generation: pseudo, antithetic or sobol",
+    )
+    return_paths: bool = Field(
+        False, description="Also write the full simulation paths as an artifact"
+    )
 
 
 class MarkowitzParams(BaseModel):
     """Markowitz portfolio optimization parameters."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     target_return: Optional[float] = Field(
         None, ge=0.0, le=1.0, description="Target portfolio return"
     )
@@ -82,11 +98,17 @@ class MarkowitzParams(BaseModel):
     covariance_method: str = Field(
         "ledoit_wolf", description="Covariance estimation method"
     )
+    # Tuples keep the frozen model hashable
+    covariance_matrix: Optional[Tuple[Tuple[float, ...], ...]] = Field(
+        None, description="Precomputed covariance matrix (skips estimation)"
+    )
 
 
 class BlackScholesParams(BaseModel):
     """Black-Scholes option pricing parameters."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     option_type: str = Field(
         ..., pattern="^(call|put)$", description="Option type: call or put"
     )
@@ -105,6 +127,8 @@ class BlackScholesParams(BaseModel):
 class BacktestParams(BaseModel):
     """Backtesting parameters."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     strategy: str = Field(..., description="Strategy name")
     rebalance_frequency: str = Field("monthly", description="Rebalancing frequency")
     transaction_costs: float = Field(
@@ -113,12 +137,20 @@ class BacktestParams(BaseModel):
     slippage: float = Field(0.0005, ge=0.0, le=0.01, description="Slippage as fraction")
 
 
+_PARAMS_MODEL_BY_JOB_TYPE = {
+    JobType.MONTE_CARLO: MonteCarloParams,
+    JobType.MARKOWITZ: MarkowitzParams,
+    JobType.BLACK_SCHOLES: BlackScholesParams,
+    JobType.BACKTEST: BacktestParams,
+}
+
+
 class CreateJobRequest(BaseModel):
     """Request to create a new job."""
 
     type: JobType = Field(..., description="Job type")
     symbols: List[str] = Field(
-        ..., min_items=1, max_items=100, description="List of symbols to analyze"
+        ..., min_length=1, max_length=100, description="List of symbols to analyze"
     )
     start: str = Field(..., description="Start date in ISO format (YYYY-MM-DD)")
     end: str = Field(..., description="End date in ISO format (YYYY-MM-DD)")
@@ -135,8 +167,9 @@ class CreateJobRequest(BaseModel):
         Dict[str, Any],
     ] = Field(..., description="Job-specific parameters")
 
-    @validator("start", "end")
-    def validate_dates(cls, v):
+    @field_validator("start", "end")
+    @classmethod
+    def validate_dates(cls, v: str) -> str:
         """Validate date format and logic."""
         try:
             date_obj = datetime.strptime(v, "%Y-%m-%d")
@@ -148,50 +181,46 @@ class CreateJobRequest(BaseModel):
                 raise e
             raise ValueError("Date must be in YYYY-MM-DD format")
 
-    @validator("end")
-    def validate_date_range(cls, v, values):
+    @field_validator("end")
+    @classmethod
+    def validate_date_range(cls, v: str, info: ValidationInfo) -> str:
         """Validate that end date is after start date."""
-        if "start" in values and v <= values["start"]:
+        if "start" in info.data and v <= info.data["start"]:
             raise ValueError("End date must be after start date")
         return v
 
-    @validator("symbols")
-    def validate_symbols(cls, v):
+    @field_validator("symbols")
+    @classmethod
+    def validate_symbols(cls, v: List[str]) -> List[str]:
         """Validate symbol format and uniqueness."""
-        if len(set(v)) != len(v):
-            raise ValueError("Symbols must be unique")
-
+        seen = set()
         for symbol in v:
-            if not symbol or len(symbol) > 20:
-                raise ValueError("Symbol must be 1-20 characters")
-            if not symbol.replace(".", "").replace("-", "").replace("/", "").isalnum():
-                raise ValueError("Symbol contains invalid characters")
+            if symbol in seen:
+                raise ValueError("Symbols must be unique")
+            seen.add(symbol)
+            if not _SYMBOL_RE.match(symbol):
+                raise ValueError(
+                    "Symbol must be 1-20 characters of letters, digits, '.', '-' or '/'"
+                )
 
         return v
 
-    @validator("params")
-    def validate_params_type(cls, v, values):
-        """Validate that params match the job type."""
-        if "type" not in values:
-            return v
-
-        job_type = values["type"]
-        if job_type == JobType.MONTE_CARLO and not isinstance(v, MonteCarloParams):
-            raise ValueError("Monte Carlo jobs require MonteCarloParams")
-        elif job_type == JobType.MARKOWITZ and not isinstance(v, MarkowitzParams):
-            raise ValueError("Markowitz jobs require MarkowitzParams")
-        elif job_type == JobType.BLACK_SCHOLES and not isinstance(
-            v, BlackScholesParams
-        ):
-            raise ValueError("Black-Scholes jobs require BlackScholesParams")
-        elif job_type == JobType.BACKTEST and not isinstance(v, BacktestParams):
-            raise ValueError("Backtest jobs require BacktestParams")
+    @field_validator("params", mode="before")
+    @classmethod
+    def validate_params_type(cls, v: Any, info: ValidationInfo) -> Any:
+        """Validate params against the model for the job type.
 
-        return v
+        Dispatching on the already-validated ``type`` runs a single params
+        model instead of trying every member of the union.
+        """
+        params_model = _PARAMS_MODEL_BY_JOB_TYPE.get(info.data.get("type"))
+        if params_model is None:
+            return v
+        return params_model.model_validate(v)
 
 
-class JobStatusResponse(BaseModel):
-    """Job status response."""
+class JobSummary(BaseModel):
+    """Job summary for list views (no params or result payloads)."""
 
     job_id: UUID = Field(..., description="Unique job identifier")
     user_id: UUID = Field(..., description="User who created the job")
@@ -203,24 +232,29 @@ class JobStatusResponse(BaseModel):
     interval: DataInterval = Field(..., description="Data interval")
     vendor: DataVendor = Field(..., description="Data vendor used")
     adjusted: bool = Field(..., description="Whether adjusted prices were used")
-    params: Dict[str, Any] = Field(..., description="Job parameters")
     created_at: datetime = Field(..., description="Job creation timestamp")
     started_at: Optional[datetime] = Field(None, description="Job start timestamp")
     finished_at: Optional[datetime] = Field(
         None, description="Job completion timestamp"
     )
-    metrics: Optional[Dict[str, Any]] = Field(None, description="Job results/metrics")
-    result_urls: Optional[List[str]] = Field(None, description="Signed URLs to results")
     error: Optional[str] = Field(None, description="Error message if failed")
     progress: Optional[float] = Field(
         None, ge=0.0, le=1.0, description="Job progress (0.0 to 1.0)"
     )
 
 
+class JobStatusResponse(JobSummary):
+    """Job status response."""
+
+    params: Dict[str, Any] = Field(..., description="Job parameters")
+    metrics: Optional[Dict[str, Any]] = Field(None, description="Job results/metrics")
+    result_urls: Optional[List[str]] = Field(None, description="Signed URLs to results")
+
+
 class JobListResponse(BaseModel):
     """List of jobs response."""
 
-    jobs: List[JobStatusResponse] = Field(..., description="List of jobs")
+    jobs: List[JobSummary] = Field(..., description="List of jobs")
     total: int = Field(..., description="Total number of jobs")
     page: int = Field(1, description="Current page number")
     size: int = Field(50, description="Page size")
@@ -1,17 +1,81 @@
+import math
+
 import numpy as np
-from scipy.stats import norm
+from numba import njit
+from scipy.special import ndtr
+
+_SQRT1_2 = 0.7071067811865476
+
+
+@njit(cache=True, fastmath=True)
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF via math.erfc (no scipy dispatch, accurate in the tails)."""
+    return 0.5 * math.erfc(-x * _SQRT1_2)
+
+
+@njit(cache=True, fastmath=True)
+def _bs_jit(S: float, K: float, T: float, r: float, sigma: float, is_call: bool):
+    """Compiled Black-Scholes price kernel."""
+    vol_sqrt_t = sigma * math.sqrt(T)
+    # log1p keeps full precision for near-the-money S ≈ K, where log(S/K) ≈ 0
+    log_moneyness = math.log1p((S - K) / K)
+    d1 = (log_moneyness + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    discount = K * math.exp(-r * T)
+    if is_call:
+        return S * _norm_cdf(d1) - discount * _norm_cdf(d2)
+    return discount * _norm_cdf(-d2) - S * _norm_cdf(-d1)
+
+
+# Trigger compilation at import so the first request doesn't pay for it
+_bs_jit(100.0, 100.0, 1.0, 0.02, 0.2, True)
 
 
 def black_scholes(
     S: float, K: float, T: float, r: float, sigma: float, option_type: str = "call"
 ):
-    """Black-Scholes price for European call/put (no dividends)."""
-    if T <= 0 or sigma <= 0 or S <= 0 or K <= 0:
+    """Black-Scholes price for European call/put (no dividends).
+
+    Scalar inputs return a float. Array inputs are priced through
+    black_scholes_vec and return an array.
+    """
+    is_call = option_type.lower() == "call"
+
+    if all(np.ndim(x) == 0 for x in (S, K, T, r, sigma)):
+        if T <= 0 or sigma <= 0 or S <= 0 or K <= 0:
+            raise ValueError("Inputs must be positive and T,sigma > 0")
+        return float(
+            _bs_jit(float(S), float(K), float(T), float(r), float(sigma), is_call)
+        )
+
+    return black_scholes_vec(S, K, T, r, sigma, is_call)
+
+
+def black_scholes_vec(S, K, T, r, sigma, option_type="call") -> np.ndarray:
+    """Vectorized Black-Scholes over broadcast arrays (e.g. a strike/expiry grid).
+
+    Args:
+        option_type: "call"/"put", a bool, or an array of either (True/"call"
+            marks calls) so a mixed chain is priced in one pass.
+
+    Returns:
+        np.ndarray of prices with the broadcast shape of the inputs
+    """
+    S, K, T, r, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma))
+    if np.any(T <= 0) or np.any(sigma <= 0) or np.any(S <= 0) or np.any(K <= 0):
         raise ValueError("Inputs must be positive and T,sigma > 0")
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    if option_type.lower() == "call":
-        price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+
+    option_type = np.asarray(option_type)
+    if option_type.dtype.kind in "US":
+        is_call = np.char.lower(option_type) == "call"
     else:
-        price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
-    return float(price)
+        is_call = option_type.astype(bool)
+
+    vol_sqrt_t = sigma * np.sqrt(T)
+    d1 = (np.log1p((S - K) / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    discount = K * np.exp(-r * T)
+    # +1 for calls, -1 for puts: both payoffs share one pair of ndtr calls,
+    # put = -(S N(-d1) - K e^{-rT} N(-d2))
+    sign = np.where(is_call, 1.0, -1.0)
+    return sign * (S * ndtr(sign * d1) - discount * ndtr(sign * d2))
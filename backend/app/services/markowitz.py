@@ -1,29 +1,126 @@
+import logging
+
 import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
 
+logger = logging.getLogger(__name__)
 
-def markowitz_optimization(returns: np.ndarray):
-    """Compute global minimum-variance portfolio (long-only weights sum to 1).
+try:
+    from sklearn.covariance import ledoit_wolf
 
-    Args:
-        returns: shape (n_obs, n_assets) log/arith returns
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+    logger.warning("scikit-learn not available. Ledoit-Wolf covariance disabled.")
 
-    Returns:
-        dict with weights (list), expected_return, volatility
+# Accepted covariance_method values
+COVARIANCE_METHODS = ("sample", "ledoit_wolf")
+
+
+class MarkowitzSolver:
+    """Mean-variance solver that factors the covariance matrix once.
+
+    The Cholesky factor Σ = L Lᵀ is used to solve for Σ⁻¹1 and Σ⁻¹μ a single
+    time in __init__. Every portfolio on the (fully invested, shorting allowed)
+    frontier is a combination of those two vectors, so the GMV, tangency and
+    target-return portfolios each cost O(n) once the solver is built.
     """
-    mean_returns = np.mean(returns, axis=0)  # (n_assets,)
-    cov_matrix = np.cov(returns.T)  # (n_assets, n_assets)
-    n = mean_returns.shape[0]
 
-    # Add small ridge to avoid singular matrix
-    cov_matrix = cov_matrix + 1e-6 * np.eye(n)
-    inv_cov = np.linalg.inv(cov_matrix)
-    ones = np.ones(n)
+    def __init__(self, returns: np.ndarray, covariance_method: str = "sample"):
+        """
+        Args:
+            returns: shape (n_obs, n_assets) log/arith returns
+            covariance_method: "sample" (default) or "ledoit_wolf" (shrunk,
+                well-conditioned)
+
+        Raises:
+            ValueError: If covariance_method is not one of COVARIANCE_METHODS
+        """
+        if covariance_method not in COVARIANCE_METHODS:
+            raise ValueError(
+                f"covariance_method must be one of {COVARIANCE_METHODS}, "
+                f"got {covariance_method!r}"
+            )
+
+        returns = np.ascontiguousarray(returns, dtype=np.float64)
+
+        if covariance_method == "ledoit_wolf" and SKLEARN_AVAILABLE:
+            # Shrinkage keeps the estimate SPD, so no ridge is needed
+            self.mean = np.mean(returns, axis=0)
+            self.cov, _ = ledoit_wolf(returns)
+        else:
+            # Two-pass (centered) estimate; an exactly degenerate sample stays
+            # exactly singular, so the ridge below still kicks in
+            self.mean = returns.mean(axis=0)
+            self.cov = np.atleast_2d(np.cov(returns, rowvar=False))
+
+        n = self.cov.shape[0]
+        try:
+            factor = cho_factor(self.cov, lower=True)
+        except LinAlgError:
+            # Singular sample covariance (e.g. fewer observations than assets
+            # or collinear assets): regularise with a small ridge only then
+            logger.warning("Covariance matrix is singular, adding a 1e-6 ridge")
+            self.cov[np.diag_indices(n)] += 1e-6
+            factor = cho_factor(self.cov, lower=True)
+        # Σ⁻¹1 and Σ⁻¹μ from one factorization (two triangular solves each)
+        self._inv_ones, self._inv_mean = cho_solve(
+            factor, np.column_stack((np.ones(n), self.mean))
+        ).T
 
-    # Global minimum variance weights: w ∝ Σ^{-1} 1
-    w = inv_cov @ ones
-    w = w / (ones @ w)
+        # Frontier constants: A = 1ᵀΣ⁻¹1, B = 1ᵀΣ⁻¹μ, C = μᵀΣ⁻¹μ, D = AC - B²
+        self._a = self._inv_ones.sum()
+        self._b = self._inv_mean.sum()
+        self._c = float(self.mean @ self._inv_mean)
+        self._d = self._a * self._c - self._b**2
 
-    port_ret = float(w @ mean_returns)
-    port_vol = float(np.sqrt(w @ cov_matrix @ w))
+    def _portfolio(self, w: np.ndarray, variance: float) -> dict:
+        return {
+            "weights": w.tolist(),
+            "expected_return": float(w @ self.mean),
+            "volatility": float(np.sqrt(variance)),
+        }
 
-    return {"weights": w.tolist(), "expected_return": port_ret, "volatility": port_vol}
+    def gmv(self) -> dict:
+        """Global minimum-variance portfolio (weights sum to 1)."""
+        # wᵀΣw = 1 / (1ᵀΣ⁻¹1) for the min-variance weights, no matmul needed
+        return self._portfolio(self._inv_ones / self._a, 1.0 / self._a)
+
+    def tangency(self, risk_free_rate: float = 0.0) -> dict:
+        """Maximum Sharpe ratio portfolio for the given risk-free rate."""
+        excess = self._b - risk_free_rate * self._a
+        if excess == 0:
+            raise ValueError("Risk-free rate equals the GMV return; no tangency")
+        w = (self._inv_mean - risk_free_rate * self._inv_ones) / excess
+        variance = (
+            self._c - 2 * risk_free_rate * self._b + risk_free_rate**2 * self._a
+        ) / excess**2
+        return self._portfolio(w, variance)
+
+    def target_return(self, mu: float) -> dict:
+        """Minimum-variance portfolio with expected return ``mu``."""
+        lam = (self._c - self._b * mu) / self._d
+        gamma = (self._a * mu - self._b) / self._d
+        w = lam * self._inv_ones + gamma * self._inv_mean
+        variance = (self._a * mu * mu - 2 * self._b * mu + self._c) / self._d
+        return self._portfolio(w, variance)
+
+    def efficient_frontier(self, target_returns: np.ndarray) -> dict:
+        """Volatility of the frontier portfolio for each target return."""
+        mu = np.asarray(target_returns, dtype=np.float64)
+        variance = (self._a * mu * mu - 2 * self._b * mu + self._c) / self._d
+        return {"returns": mu.tolist(), "volatilities": np.sqrt(variance).tolist()}
+
+
+def markowitz_optimization(returns: np.ndarray, covariance_method: str = "sample"):
+    """Compute global minimum-variance portfolio (weights sum to 1, shorting allowed).
+
+    Args:
+        returns: shape (n_obs, n_assets) log/arith returns
+        covariance_method: "sample" (default) or "ledoit_wolf" (shrunk,
+            well-conditioned)
+
+    Returns:
+        dict with weights (list), expected_return, volatility
+    """
+    return MarkowitzSolver(returns, covariance_method).gmv()
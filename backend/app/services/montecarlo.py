@@ -1,19 +1,94 @@
+import logging
+import math
+from typing import Optional
+
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+try:
+    from .montecarlo_numba import mc_terminal_prices
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available. Monte Carlo uses the NumPy fallback.")
+
 
 def monte_carlo_simulation(
-    S0: float, mu: float, sigma: float, T: float, steps: int, n_sims: int
+    S0: float,
+    mu: float,
+    sigma: float,
+    T: float,
+    steps: int,
+    n_sims: int,
+    return_paths: bool = False,
+    seed: Optional[int] = None,
+    antithetic: bool = False,
 ):
     """Geometric Brownian Motion paths (no dividends).
 
+    Args:
+        return_paths: keep every time step; otherwise only the terminal prices
+            are allocated and updated in place.
+        seed: optional seed for reproducible paths; reusing a seed across
+            scenarios gives common random numbers for comparing them
+        antithetic: pair every path with its mirror (shocks negated), which
+            halves the draws and reduces estimator variance
+
     Returns:
-        np.ndarray: shape (steps, n_sims)
+        np.ndarray: shape (steps + 1, n_sims) if return_paths else (n_sims,)
     """
     dt = T / steps
-    prices = np.zeros((steps + 1, n_sims), dtype=float)
+    drift = (mu - 0.5 * sigma**2) * dt
+    vol = sigma * math.sqrt(dt)
+    n_draw = (n_sims + 1) // 2 if antithetic else n_sims
+
+    if not return_paths:
+        if NUMBA_AVAILABLE:
+            return mc_terminal_prices(
+                float(S0),
+                float(mu),
+                float(sigma),
+                float(T),
+                int(steps),
+                int(n_sims),
+                -1 if seed is None else int(seed),
+                antithetic,
+            )
+
+        rng = np.random.default_rng(seed)
+        log_price = np.zeros(n_sims, dtype=np.float64)
+        drawn = log_price[:n_draw]
+        z = np.empty(n_draw, dtype=np.float64)
+        for _ in range(steps):
+            rng.standard_normal(out=z)
+            z *= vol
+            z += drift
+            drawn += z
+        # Antithetic partners: Σ(drift - z) = 2 * steps * drift - Σ(drift + z)
+        np.subtract(
+            2.0 * steps * drift, drawn[: n_sims - n_draw], out=log_price[n_draw:]
+        )
+        np.exp(log_price, out=log_price)
+        log_price *= S0
+        return log_price
+
+    # One buffer for the whole matrix: draw shocks into rows 1..steps, turn them
+    # into log-increments, cumulate and exponentiate in place
+    prices = np.empty((steps + 1, n_sims), dtype=np.float64)
+    log_incr = prices[1:]
+    rng = np.random.default_rng(seed)
+    if antithetic:
+        shocks = rng.standard_normal((steps, n_draw))
+        log_incr[:, :n_draw] = shocks
+        np.negative(shocks[:, : n_sims - n_draw], out=log_incr[:, n_draw:])
+    else:
+        rng.standard_normal(out=log_incr)
+    log_incr *= vol
+    log_incr += drift
+    np.cumsum(log_incr, axis=0, out=log_incr)
+    np.exp(log_incr, out=log_incr)
+    log_incr *= S0
     prices[0] = S0
-    for t in range(1, steps + 1):
-        z = np.random.normal(0.0, 1.0, size=n_sims)
-        growth = (mu - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * z
-        prices[t] = prices[t - 1] * np.exp(growth)
     return prices
@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def mc_terminal_prices(
+    S0: float,
+    mu: float,
+    sigma: float,
+    T: float,
+    steps: int,
+    n_sims: int,
+    seed: int,
+    antithetic: bool = False,
+):
+    """Terminal GBM prices, one path per prange iteration.
+
+    Each path keeps its log-price in a register, so nothing of size
+    (steps, n_sims) is ever allocated. Numba's RNG state is per thread; when
+    seed >= 0 path i is seeded with seed + i so results don't depend on how
+    paths are scheduled across threads.
+
+    With antithetic=True only ceil(n_sims / 2) paths are drawn; path
+    i + n_draw reuses the negated shocks of path i.
+    """
+    dt = T / steps
+    drift = (mu - 0.5 * sigma * sigma) * dt
+    vol = sigma * math.sqrt(dt)
+    # Σ(drift - z) = 2 * steps * drift - Σ(drift + z)
+    mirror = 2.0 * steps * drift
+    n_draw = (n_sims + 1) // 2 if antithetic else n_sims
+    final = np.empty(n_sims)
+    for i in prange(n_draw):
+        if seed >= 0:
+            np.random.seed(seed + i)
+        log_price = 0.0
+        for _ in range(steps):
+            log_price += drift + vol * np.random.normal()
+        final[i] = S0 * math.exp(log_price)
+        if i + n_draw < n_sims:
+            final[i + n_draw] = S0 * math.exp(mirror - log_price)
+    return final
@@ -0,0 +1,85 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Job
+
+
+@pytest.fixture
+def db():
+    """In-memory database session with the jobs table."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _add_jobs(db, user_id, job_types):
+    """Insert one job per type, newest last."""
+    created = datetime(2024, 1, 1)
+    for i, job_type in enumerate(job_types):
+        db.add(
+            Job(
+                user_id=user_id,
+                type=job_type,
+                status="queued",
+                params_json={},
+                symbols=["AAPL"],
+                start_ts=datetime(2023, 1, 1),
+                end_ts=datetime(2023, 12, 31),
+                interval="1d",
+                vendor="eodhd",
+                created_at=created + timedelta(minutes=i),
+            )
+        )
+    db.commit()
+
+
+def test_get_user_jobs_total_from_window_count(db):
+    """Test total comes from the window count on a full page."""
+    user_id = uuid.uuid4()
+    _add_jobs(db, user_id, ["montecarlo"] * 5)
+    _add_jobs(db, uuid.uuid4(), ["montecarlo"] * 2)
+
+    jobs, total = Job.get_user_jobs(db, user_id, page=1, size=2)
+
+    assert len(jobs) == 2
+    assert total == 5
+    assert jobs[0].created_at > jobs[1].created_at
+
+
+def test_get_user_jobs_total_past_last_page(db):
+    """Test total is still reported when the page is past the last row."""
+    user_id = uuid.uuid4()
+    _add_jobs(db, user_id, ["montecarlo"] * 3)
+
+    jobs, total = Job.get_user_jobs(db, user_id, page=5, size=2)
+
+    assert jobs == []
+    assert total == 3
+
+
+def test_get_user_jobs_filters_before_paging(db):
+    """Test type filters apply in SQL, so pages and total match the filter."""
+    user_id = uuid.uuid4()
+    _add_jobs(db, user_id, ["montecarlo", "markowitz"] * 3)
+
+    rows, total = Job.get_user_jobs_light(
+        db, user_id, page=1, size=2, job_type="markowitz"
+    )
+
+    assert total == 3
+    assert [row.type for row in rows] == ["markowitz", "markowitz"]
+
+
+def test_get_user_jobs_no_jobs(db):
+    """Test an unknown user gets an empty first page and zero total."""
+    jobs, total = Job.get_user_jobs(db, uuid.uuid4())
+
+    assert jobs == []
+    assert total == 0
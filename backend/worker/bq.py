@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import logging
 import os
+import threading
 from datetime import datetime
 from typing import List
 
+import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 try:
     from google.cloud import bigquery
 
     BQ_AVAILABLE = True
 except ImportError:
     BQ_AVAILABLE = False
-    print(
-        "Warning: google-cloud-bigquery not available. BigQuery functionality disabled."
+    logger.warning(
+        "google-cloud-bigquery not available. BigQuery functionality disabled."
+    )
+
+try:
+    from google.cloud import bigquery_storage
+
+    BQ_STORAGE_AVAILABLE = True
+except ImportError:
+    BQ_STORAGE_AVAILABLE = False
+    logger.warning(
+        "google-cloud-bigquery-storage not available. "
+        "Query results will be downloaded over the REST API."
     )
 
 try:
@@ -22,7 +38,7 @@ try:
     FIXTURE_AVAILABLE = True
 except ImportError:
     FIXTURE_AVAILABLE = False
-    print("Warning: demo_loader not available. Fixture functionality disabled.")
+    logger.warning("demo_loader not available. Fixture functionality disabled.")
 
 
 class BigQueryLoader:
@@ -41,6 +57,13 @@ class BigQueryLoader:
         else:
             self.client = None
 
+        # Storage Read API streams results as Arrow record batches instead of
+        # paginated JSON rows
+        if BQ_AVAILABLE and BQ_STORAGE_AVAILABLE:
+            self.bqstorage_client = bigquery_storage.BigQueryReadClient()
+        else:
+            self.bqstorage_client = None
+
     def load_prices(
         self,
         symbols: List[str],
@@ -67,14 +90,13 @@ class BigQueryLoader:
         # Check if fixture mode is enabled
         if FIXTURE_AVAILABLE and should_use_fixture():
             try:
-                print(f"Using fixture data for symbols: {symbols}")
+                logger.info(f"Using fixture data for symbols: {symbols}")
                 return load_fixture_prices(
                     symbols, start_date, end_date, interval, adjusted
                 )
             except Exception as e:
-                print(
-                    f"Warning: Failed to load fixture data: {e}. "
-                    f"Falling back to BigQuery."
+                logger.warning(
+                    f"Failed to load fixture data: {e}. " f"Falling back to BigQuery."
                 )
 
         # Fall back to BigQuery
@@ -88,16 +110,26 @@ class BigQueryLoader:
         # Build query based on data type and interval
         if interval == "1d" and adjusted:
             # Use adjusted prices view for daily data
-            query = self._build_adjusted_prices_query(symbols, start_dt, end_dt, vendor)
+            query = self._build_adjusted_prices_query()
         else:
             # Use raw prices table
-            query = self._build_raw_prices_query(
-                symbols, start_dt, end_dt, interval, vendor
-            )
+            query = self._build_raw_prices_query()
+
+        # Bind values as parameters so the query text stays identical across
+        # symbol sets and date ranges (cacheable, and not injectable)
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("symbols", "STRING", symbols),
+                bigquery.ScalarQueryParameter("vendor", "STRING", vendor),
+                bigquery.ScalarQueryParameter("interval", "STRING", interval),
+                bigquery.ScalarQueryParameter("start", "TIMESTAMP", start_dt),
+                bigquery.ScalarQueryParameter("end", "TIMESTAMP", end_dt),
+            ]
+        )
 
         try:
             # Execute query
-            df = self.client.query(query).to_dataframe()
+            df = self._query_to_dataframe(query, job_config)
 
             if df.empty:
                 raise ValueError(
@@ -113,72 +145,76 @@ class BigQueryLoader:
         except Exception as e:
             raise RuntimeError(f"Failed to load prices from BigQuery: {e}")
 
-    def _build_adjusted_prices_query(
-        self, symbols: List[str], start_dt: datetime, end_dt: datetime, vendor: str
-    ) -> str:
-        """Build query for adjusted prices view."""
-        symbols_str = ", ".join([f"'{s}'" for s in symbols])
+    def _query_to_dataframe(
+        self, query: str, job_config: "bigquery.QueryJobConfig"
+    ) -> pd.DataFrame:
+        """Run a query and fetch its results through Arrow."""
+        table = self.client.query(query, job_config=job_config).to_arrow(
+            bqstorage_client=self.bqstorage_client
+        )
+        return table.to_pandas()
+
+    def _build_adjusted_prices_query(self) -> str:
+        """Build query for adjusted prices view.
 
+        Expects @symbols, @vendor, @start and @end query parameters. Rows are
+        left unordered; the wide-format pivot sorts by timestamp.
+        """
         query = f"""
         SELECT
             ts_utc,
             symbol,
             adj_close as close
         FROM `{self.project_id}.{self.dataset_curated}.v_adjusted_prices`
-        WHERE symbol IN ({symbols_str})
-        AND vendor = '{vendor}'
-        AND ts_utc >= TIMESTAMP('{start_dt.isoformat()}')
-        AND ts_utc <= TIMESTAMP('{end_dt.isoformat()}')
-        ORDER BY ts_utc, symbol
+        WHERE symbol IN UNNEST(@symbols)
+        AND vendor = @vendor
+        AND ts_utc BETWEEN @start AND @end
         """
 
         return query
 
-    def _build_raw_prices_query(
-        self,
-        symbols: List[str],
-        start_dt: datetime,
-        end_dt: datetime,
-        interval: str,
-        vendor: str,
-    ) -> str:
-        """Build query for raw prices table."""
-        symbols_str = ", ".join([f"'{s}'" for s in symbols])
+    def _build_raw_prices_query(self) -> str:
+        """Build query for raw prices table.
 
+        Expects @symbols, @vendor, @interval, @start and @end query parameters.
+        """
         query = f"""
         SELECT
             ts_utc,
             symbol,
             close
         FROM `{self.project_id}.{self.dataset_raw}.eq_ohlcv`
-        WHERE symbol IN ({symbols_str})
-        AND vendor = '{vendor}'
-        AND interval = '{interval}'
-        AND ts_utc >= TIMESTAMP('{start_dt.isoformat()}')
-        AND ts_utc <= TIMESTAMP('{end_dt.isoformat()}')
-        ORDER BY ts_utc, symbol
+        WHERE symbol IN UNNEST(@symbols)
+        AND vendor = @vendor
+        AND interval = @interval
+        AND ts_utc BETWEEN @start AND @end
         """
 
         return query
 
     def _pivot_to_wide_format(self, df: pd.DataFrame, interval: str) -> pd.DataFrame:
         """Convert long format DataFrame to wide format with symbols as columns."""
-        # Ensure ts_utc is datetime
-        df["ts_utc"] = pd.to_datetime(df["ts_utc"])
+        # Map each row to a (timestamp, symbol) cell; both axes come out sorted
+        t_idx, uniq_ts = pd.factorize(pd.to_datetime(df["ts_utc"]), sort=True)
+        symbols = pd.Categorical(df["symbol"])
+
+        # Scatter closes into one preallocated (T, N) array
+        out = np.full((len(uniq_ts), len(symbols.categories)), np.nan)
+        out[t_idx, symbols.codes] = df["close"].to_numpy(dtype=np.float64)
 
-        # Pivot to wide format
-        df_wide = df.pivot(index="ts_utc", columns="symbol", values="close")
+        df_wide = pd.DataFrame(
+            out,
+            index=pd.Index(uniq_ts, name="ts_utc"),
+            columns=pd.Index(symbols.categories, name="symbol"),
+        )
 
         # Forward fill missing values (for intraday data)
         if interval != "1d":
-            df_wide = df_wide.fillna(method="ffill")
+            df_wide = df_wide.ffill()
 
         # Drop rows with all NaN values
         df_wide = df_wide.dropna(how="all")
 
-        # Sort by timestamp
-        df_wide = df_wide.sort_index()
-
         return df_wide
 
     def to_returns(self, df_prices: pd.DataFrame, method: str = "log") -> pd.DataFrame:
@@ -192,24 +228,29 @@ class BigQueryLoader:
         Returns:
             DataFrame with returns
         """
-        if method == "log":
-            # Log returns: log(P_t / P_{t-1})
-            returns = df_prices.pct_change().dropna()
-        elif method == "simple":
-            # Simple returns: (P_t - P_{t-1}) / P_{t-1}
-            returns = df_prices.pct_change().dropna()
-        else:
-            raise ValueError("Method must be 'log' or 'simple'")
+        returns, complete = _price_returns(df_prices, method)
+        return pd.DataFrame(
+            returns[complete],
+            index=df_prices.index[1:][complete],
+            columns=df_prices.columns,
+        )
+
+    def to_returns_array(
+        self, df_prices: pd.DataFrame, method: str = "log"
+    ) -> np.ndarray:
+        """
+        Convert prices to a (T - 1, N) returns array, skipping the DataFrame wrapper.
 
-        return returns
+        Rows with any missing return are dropped, as in to_returns.
+        """
+        returns, complete = _price_returns(df_prices, method)
+        return returns[complete]
 
     def get_symbol_info(self, symbols: List[str]) -> pd.DataFrame:
         """Get basic information about symbols."""
         if not self.client:
             raise RuntimeError("BigQuery client not available")
 
-        symbols_str = ", ".join([f"'{s}'" for s in symbols])
-
         query = f"""
         SELECT
             symbol,
@@ -218,22 +259,49 @@ class BigQueryLoader:
             asset_type,
             is_active
         FROM `{self.project_id}.{self.dataset_raw}.vendor_symbol_map`
-        WHERE symbol IN ({symbols_str})
+        WHERE symbol IN UNNEST(@symbols)
         AND is_active = true
         """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("symbols", "STRING", symbols),
+            ]
+        )
 
         try:
-            df = self.client.query(query).to_dataframe()
+            df = self._query_to_dataframe(query, job_config)
             return df
         except Exception as e:
-            print(f"Warning: Failed to get symbol info: {e}")
+            logger.warning(f"Failed to get symbol info: {e}")
             return pd.DataFrame()
 
 
-# Global loader instance
-bq_loader = BigQueryLoader()
+def _price_returns(df_prices: pd.DataFrame, method: str):
+    """Returns over a float64 view of the prices, plus a mask of NaN-free rows."""
+    arr = df_prices.to_numpy(dtype=np.float64, copy=False)
+
+    if method == "log":
+        # Log returns: log(P_t / P_{t-1})
+        returns = np.diff(np.log(arr), axis=0)
+    elif method == "simple":
+        # Simple returns: (P_t - P_{t-1}) / P_{t-1}
+        returns = arr[1:] / arr[:-1] - 1.0
+    else:
+        raise ValueError("Method must be 'log' or 'simple'")
+
+    return returns, ~np.isnan(returns).any(axis=1)
+
+
+# Global loader instance - initialize lazily
+_bq_loader = None
+_bq_loader_lock = threading.Lock()
 
 
 def get_bq_loader() -> BigQueryLoader:
     """Get BigQuery loader instance."""
-    return bq_loader
+    global _bq_loader
+    if _bq_loader is None:
+        with _bq_loader_lock:
+            if _bq_loader is None:
+                _bq_loader = BigQueryLoader()
+    return _bq_loader
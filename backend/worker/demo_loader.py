@@ -5,12 +5,26 @@ This module provides fixture price data when USE_FIXTURE=true,
 allowing the application to run fully functional demos.
 """
 
+import copy
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
+from scipy.linalg.blas import dsyrk
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Seed for the simulated fixture metrics, so demo results are reproducible
+_RNG_SEED = 42
 
 
 def should_use_fixture() -> bool:
@@ -41,57 +55,72 @@ def load_fixture_prices(
     if not should_use_fixture():
         raise ValueError("Fixture mode not enabled. Set USE_FIXTURE=true")
 
-    # Load the fixture CSV
-    fixture_path = os.path.join(
-        os.path.dirname(__file__), "fixtures", "prices_demo.csv"
-    )
-
-    if not os.path.exists(fixture_path):
-        raise FileNotFoundError(f"Fixture file not found: {fixture_path}")
-
-    # Read CSV and filter by symbols
-    df = pd.read_csv(fixture_path)
-    df["date"] = pd.to_datetime(df["date"])
+    df = _load_fixture_df()
 
-    # Filter by date range
+    # Select the requested symbols and date range straight from the
+    # (symbol, date) index
+    present = sorted(set(symbols).intersection(df.index.levels[0]))
     start_dt = pd.to_datetime(start_date)
     end_dt = pd.to_datetime(end_date)
-    df = df[(df["date"] >= start_dt) & (df["date"] <= end_dt)]
+    prices = df.loc[
+        (present, slice(start_dt, end_dt)), "adjusted_close" if adjusted else "close"
+    ]
 
-    # Filter by symbols
-    df = df[df["symbol"].isin(symbols)]
-
-    if df.empty:
+    if prices.empty:
         raise ValueError(
             f"No data found for symbols {symbols} in date range "
             f"{start_date} to {end_date}"
         )
 
     # Convert to wide format (one column per symbol)
-    wide_df = df.pivot(
-        index="date", columns="symbol", values="adjusted_close" if adjusted else "close"
-    )
-
-    # Sort by date
-    wide_df = wide_df.sort_index()
+    wide_df = prices.unstack("symbol")
+    wide_df.columns = pd.Index(wide_df.columns.astype(str), name="symbol")
 
-    # Forward fill any missing values
-    wide_df = wide_df.fillna(method="ffill")
+    # Forward fill missing values; daily bars usually have no gaps, so skip
+    # the column-by-column fill when there is nothing to fill
+    if wide_df.isna().values.any():
+        wide_df = wide_df.ffill()
 
     return wide_df
 
 
 def get_fixture_symbols() -> List[str]:
     """Get list of available symbols in fixture data."""
-    fixture_path = os.path.join(
-        os.path.dirname(__file__), "fixtures", "prices_demo.csv"
-    )
-
-    if not os.path.exists(fixture_path):
+    try:
+        df = _load_fixture_df()
+    except FileNotFoundError:
         return []
 
-    df = pd.read_csv(fixture_path)
-    return sorted(df["symbol"].unique().tolist())
+    return sorted(df.index.levels[0].astype(str).tolist())
+
+
+@lru_cache(maxsize=1)
+def _load_fixture_df() -> pd.DataFrame:
+    """
+    Load the static fixture prices once per process.
+
+    Prefers prices_demo.parquet (built by fixtures/build_parquet.py), which is
+    stored already typed and indexed. The result is indexed by (symbol, date)
+    and sorted so lookups are index slices.
+    """
+    fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures")
+    parquet_path = os.path.join(fixtures_dir, "prices_demo.parquet")
+    csv_path = os.path.join(fixtures_dir, "prices_demo.csv")
+
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path)
+
+    if os.path.exists(csv_path):
+        df = pd.read_csv(
+            csv_path,
+            parse_dates=["date"],
+            cache_dates=True,
+            dtype={"symbol": "category"},
+        )
+    else:
+        raise FileNotFoundError(f"Fixture file not found: {csv_path}")
+
+    return df.set_index(["symbol", "date"]).sort_index()
 
 
 def generate_fixture_metrics(
@@ -131,6 +160,48 @@ def generate_fixture_metrics(
         return {"error": f"Unknown job type: {job_type}"}
 
 
+def _mc_kernel(
+    n_sims: int, n_steps: int, mu: float, sigma: float, seed: int, n_head: int
+):
+    """Stream the cumulative product of (1 + r) per simulation.
+
+    Only the final growth factor of each path and the first ``n_head`` full
+    paths are kept, so no (n_sims, n_steps) matrix is allocated. Path i is
+    seeded with seed + i, making results independent of thread scheduling.
+    """
+    finals = np.empty(n_sims)
+    paths_head = np.empty((n_head, n_steps))
+    for i in prange(n_sims):
+        np.random.seed(seed + i)
+        growth = 1.0
+        for t in range(n_steps):
+            growth *= 1.0 + mu + sigma * np.random.normal()
+            if i < n_head:
+                paths_head[i, t] = growth
+        finals[i] = growth
+    return finals, paths_head
+
+
+def _mc_kernel_numpy(
+    n_sims: int, n_steps: int, mu: float, sigma: float, seed: int, n_head: int
+):
+    """Vectorized fallback for _mc_kernel when numba is not installed.
+
+    Draws all shocks in one call from a local Generator (leaving the global
+    np.random state untouched) and takes the cumulative product along time.
+    """
+    rng = np.random.default_rng(seed)
+    shocks = rng.standard_normal((n_sims, n_steps))
+    growth = np.cumprod(1.0 + mu + sigma * shocks, axis=1)
+    return growth[:, -1].copy(), growth[:n_head].copy()
+
+
+if NUMBA_AVAILABLE:
+    _mc_kernel = njit(parallel=True, fastmath=True, cache=True)(_mc_kernel)
+else:
+    _mc_kernel = _mc_kernel_numpy
+
+
 def _generate_monte_carlo_metrics(
     symbols: List[str], params: Dict[str, Any], prices_df: Optional[pd.DataFrame]
 ) -> Dict[str, Any]:
@@ -138,25 +209,30 @@ def _generate_monte_carlo_metrics(
     num_simulations = params.get("simulations", 1000)
     time_steps = params.get("time_steps", 252)
 
-    # Generate realistic simulation results
-    np.random.seed(42)  # For reproducible results
-
-    # Simulate returns
-    returns = np.random.normal(0.0008, 0.02, (num_simulations, time_steps))
-    cumulative_returns = np.cumprod(1 + returns, axis=1)
+    # Generate realistic simulation results (seeded for reproducible results),
+    # keeping the first 10 paths for visualization
+    finals, paths_head = _mc_kernel(
+        num_simulations,
+        time_steps,
+        0.0008,
+        0.02,
+        _RNG_SEED,
+        min(10, num_simulations),
+    )
 
     # Calculate metrics
-    final_returns = cumulative_returns[:, -1] - 1
+    final_returns = finals - 1
     mean_return = np.mean(final_returns)
     std_return = np.std(final_returns)
 
-    # Percentiles
+    # Percentiles, all from a single partition of final_returns
+    qs = np.quantile(final_returns, [0.05, 0.25, 0.5, 0.75, 0.95])
     percentiles = {
-        "p5": np.percentile(final_returns, 5),
-        "p25": np.percentile(final_returns, 25),
-        "p50": np.percentile(final_returns, 50),
-        "p75": np.percentile(final_returns, 75),
-        "p95": np.percentile(final_returns, 95),
+        "p5": float(qs[0]),
+        "p25": float(qs[1]),
+        "p50": float(qs[2]),
+        "p75": float(qs[3]),
+        "p95": float(qs[4]),
     }
 
     return {
@@ -165,34 +241,43 @@ def _generate_monte_carlo_metrics(
         "mean_return": float(mean_return),
         "std_return": float(std_return),
         "percentiles": percentiles,
-        "simulation_paths": cumulative_returns.tolist()[
-            :10
-        ],  # First 10 paths for visualization
+        "simulation_paths": paths_head.tolist(),
     }
 
 
+def _covariance_rows(returns: np.ndarray, means: np.ndarray) -> np.ndarray:
+    """Sample covariance of the rows of ``returns`` (same result as np.cov).
+
+    Uses the BLAS symmetric rank-k update, which only computes the upper
+    triangle, then mirrors it.
+    """
+    centered = returns - means[:, None]
+    upper = dsyrk(1.0 / (returns.shape[1] - 1), centered, lower=0)
+    return np.triu(upper) + np.triu(upper, 1).T
+
+
 def _generate_markowitz_metrics(
     symbols: List[str], params: Dict[str, Any], prices_df: Optional[pd.DataFrame]
 ) -> Dict[str, Any]:
     """Generate Markowitz portfolio optimization metrics."""
-    # Generate realistic portfolio metrics
-    np.random.seed(42)
+    # Generate realistic portfolio metrics from a local Philox generator
+    # (no shared global RNG state)
+    rng = np.random.default_rng(np.random.Philox(_RNG_SEED))
 
     # Simulate returns for each symbol
     n_symbols = len(symbols)
-    returns = np.random.normal(0.001, 0.02, (n_symbols, 252))
+    returns = rng.normal(0.001, 0.02, (n_symbols, 252))
 
     # Calculate portfolio statistics
     portfolio_returns = np.mean(returns, axis=1)
-    portfolio_cov = np.cov(returns)
+    portfolio_cov = _covariance_rows(returns, portfolio_returns)
 
     # Generate optimal weights (simplified)
-    weights = np.random.dirichlet(np.ones(n_symbols))
-    weights = weights / np.sum(weights)
+    weights = rng.dirichlet(np.ones(n_symbols))
 
     # Calculate portfolio metrics
     expected_return = float(np.sum(portfolio_returns * weights))
-    volatility = float(np.sqrt(weights.T @ portfolio_cov @ weights))
+    volatility = float(np.sqrt(np.einsum("i,ij,j->", weights, portfolio_cov, weights)))
     sharpe_ratio = expected_return / volatility if volatility > 0 else 0
 
     return {
@@ -259,7 +344,7 @@ def create_fixture_artifacts(
     job_type: str, symbols: List[str], params: Dict[str, Any]
 ) -> Dict[str, Any]:
     """
-    Create fixture artifacts (CSV files, charts) for job results.
+    Create fixture artifacts (Parquet files, charts) for job results.
 
     Args:
         job_type: Type of financial model
@@ -272,20 +357,48 @@ def create_fixture_artifacts(
     if not should_use_fixture():
         raise ValueError("Fixture mode not enabled. Set USE_FIXTURE=true")
 
+    try:
+        cache_key = (job_type, tuple(symbols), frozenset(params.items()))
+        hash(cache_key)
+    except TypeError:
+        # Unhashable parameter values (e.g. lists) are simply not cached
+        return _build_fixture_artifacts(job_type, symbols, params)
+
+    artifacts = _cached_fixture_artifacts(*cache_key)
+
+    # The cached dict is shared between identical requests; hand out a copy
+    # so callers cannot mutate the cache entry
+    return copy.deepcopy(artifacts)
+
+
+@lru_cache(maxsize=128)
+def _cached_fixture_artifacts(
+    job_type: str, symbols: tuple, params: frozenset
+) -> Dict[str, Any]:
+    """Fixture artifacts keyed by (job_type, symbols, params).
+
+    Fixture data is static, so each distinct request is only materialized
+    once per process (up to the most recent 128 requests).
+    """
+    return _build_fixture_artifacts(job_type, list(symbols), dict(params))
+
+
+def _build_fixture_artifacts(
+    job_type: str, symbols: List[str], params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Generate the fixture metrics and mock artifact references."""
     # Generate metrics
     metrics = generate_fixture_metrics(job_type, symbols, params)
 
     # Create mock artifact references
-    artifacts = {
+    return {
         "metrics": metrics,
         "charts": {
             "price_chart": f"fixture_charts/{job_type}_prices.png",
             "results_chart": f"fixture_charts/{job_type}_results.png",
         },
         "data": {
-            "raw_data": f"fixture_data/{job_type}_raw.csv",
-            "processed_data": f"fixture_data/{job_type}_processed.csv",
+            "raw_data": f"fixture_data/{job_type}_raw.parquet",
+            "processed_data": f"fixture_data/{job_type}_processed.parquet",
         },
     }
-
-    return artifacts
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Convert prices_demo.csv to prices_demo.parquet.
+
+Run once at image build time so fixture mode loads a pre-typed, pre-indexed
+columnar file instead of parsing the CSV on every cold start.
+"""
+
+import os
+
+import pandas as pd
+
+FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(FIXTURES_DIR, "prices_demo.csv")
+PARQUET_PATH = os.path.join(FIXTURES_DIR, "prices_demo.parquet")
+
+
+def build_parquet(csv_path: str = CSV_PATH, parquet_path: str = PARQUET_PATH):
+    """Write the fixture prices as Parquet, indexed by (symbol, date)."""
+    df = pd.read_csv(
+        csv_path,
+        parse_dates=["date"],
+        dtype={
+            "symbol": "category",
+            "open": "float64",
+            "high": "float64",
+            "low": "float64",
+            "close": "float64",
+            "volume": "int64",
+            "adjusted_close": "float64",
+        },
+    )
+
+    # Store the frame exactly as demo_loader uses it so loading is a plain read
+    df = df.set_index(["symbol", "date"]).sort_index()
+    df.to_parquet(parquet_path, compression="zstd")
+
+    print(f"Wrote {len(df)} rows to {parquet_path}")
+
+
+if __name__ == "__main__":
+    build_parquet()
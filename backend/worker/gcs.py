@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import io
 import json
+import logging
 import os
+import threading
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
 
 try:
     from google.cloud import storage
@@ -13,7 +21,17 @@ try:
     GCS_AVAILABLE = True
 except ImportError:
     GCS_AVAILABLE = False
-    print("Warning: google-cloud-storage not available. GCS functionality disabled.")
+    logger.warning("google-cloud-storage not available. GCS functionality disabled.")
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Maximum number of calls GCS accepts in a single batch request
+GCS_BATCH_SIZE = 100
 
 
 class GCSWriter:
@@ -56,14 +74,25 @@ class GCSWriter:
         # Create job directory path
         job_path = f"jobs/{job_id}/{filename}"
 
-        # Convert metrics to JSON string
-        metrics_json = json.dumps(metrics, indent=2, default=str)
+        # Convert metrics to JSON bytes
+        if ORJSON_AVAILABLE:
+            # NumPy arrays/scalars and datetimes are encoded natively
+            metrics_json = orjson.dumps(
+                metrics,
+                default=str,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NAIVE_UTC
+                | orjson.OPT_NON_STR_KEYS,
+            )
+        else:
+            metrics_json = json.dumps(metrics, indent=2, default=str)
 
         # Write to GCS
         blob = self.bucket.blob(job_path)
         blob.upload_from_string(metrics_json, content_type="application/json")
 
-        print(f"Wrote metrics to gs://{self.bucket_name}/{job_path}")
+        logger.info(f"Wrote metrics to gs://{self.bucket_name}/{job_path}")
         return job_path
 
     def write_artifact_csv(self, job_id: str, df: pd.DataFrame, filename: str) -> str:
@@ -84,14 +113,15 @@ class GCSWriter:
         # Create job directory path
         job_path = f"jobs/{job_id}/{filename}"
 
-        # Convert DataFrame to CSV string
-        csv_string = df.to_csv(index=True)
+        # Encode CSV straight into a bytes buffer (no intermediate str)
+        buf = io.BytesIO()
+        df.to_csv(buf, index=True, encoding="utf-8")
 
         # Write to GCS
         blob = self.bucket.blob(job_path)
-        blob.upload_from_string(csv_string, content_type="text/csv")
+        blob.upload_from_file(buf, rewind=True, content_type="text/csv")
 
-        print(f"Wrote CSV to gs://{self.bucket_name}/{job_path}")
+        logger.info(f"Wrote CSV to gs://{self.bucket_name}/{job_path}")
         return job_path
 
     def write_artifact_parquet(
@@ -114,18 +144,67 @@ class GCSWriter:
         # Create job directory path
         job_path = f"jobs/{job_id}/{filename}"
 
-        # Convert DataFrame to Parquet bytes
-        parquet_bytes = df.to_parquet(index=True)
+        # Convert DataFrame to an Arrow table and write Parquet into a buffer
+        buf = io.BytesIO()
+        pq.write_table(pa.Table.from_pandas(df), buf, compression="snappy")
+
+        # Write to GCS
+        blob = self.bucket.blob(job_path)
+        blob.upload_from_file(buf, rewind=True, content_type="application/octet-stream")
+
+        logger.info(f"Wrote Parquet to gs://{self.bucket_name}/{job_path}")
+        return job_path
+
+    def write_artifact_array(
+        self,
+        job_id: str,
+        array: np.ndarray,
+        name: str,
+        column_names: Optional[List[str]] = None,
+    ) -> str:
+        """
+        Write a 2-D NumPy array to GCS as Parquet, one column per array column.
+
+        Args:
+            job_id: Job identifier
+            array: 2-D array to write
+            name: Artifact name
+            column_names: Column names (defaults to "0", "1", ...)
+
+        Returns:
+            GCS object path
+        """
+        if not self.bucket:
+            raise RuntimeError("GCS client not available")
+
+        array = np.asarray(array)
+        if array.ndim != 2:
+            raise ValueError("Array artifacts must be 2-D")
+        if column_names is None:
+            column_names = [str(i) for i in range(array.shape[1])]
+
+        # Create job directory path
+        job_path = f"jobs/{job_id}/{name}.parquet"
+
+        # Column-major layout makes each column a contiguous slice, so Arrow
+        # wraps it without copying (no DataFrame in between)
+        columns = np.asfortranarray(array)
+        table = pa.Table.from_arrays(
+            [pa.array(columns[:, i]) for i in range(columns.shape[1])],
+            names=column_names,
+        )
+        buf = io.BytesIO()
+        pq.write_table(table, buf, compression="snappy")
 
         # Write to GCS
         blob = self.bucket.blob(job_path)
-        blob.upload_from_string(parquet_bytes, content_type="application/octet-stream")
+        blob.upload_from_file(buf, rewind=True, content_type="application/octet-stream")
 
-        print(f"Wrote Parquet to gs://{self.bucket_name}/{job_path}")
+        logger.info(f"Wrote Parquet to gs://{self.bucket_name}/{job_path}")
         return job_path
 
     def write_artifact_dataframe(
-        self, job_id: str, df: pd.DataFrame, name: str, format: str = "csv"
+        self, job_id: str, df: pd.DataFrame, name: str, format: str = "parquet"
     ) -> str:
         """
         Write DataFrame to GCS in specified format.
@@ -166,19 +245,13 @@ class GCSWriter:
 
         # List all objects in job directory
         job_prefix = f"jobs/{job_id}/"
-        blobs = self.client.list_blobs(self.bucket, prefix=job_prefix)
+        blobs = list(self.client.list_blobs(self.bucket, prefix=job_prefix))
 
-        signed_urls = []
         expiration = timedelta(minutes=expiration_minutes)
-
-        for blob in blobs:
-            # Generate signed URL
-            url = blob.generate_signed_url(
-                version="v4", expiration=expiration, method="GET"
-            )
-            signed_urls.append(url)
-
-        return signed_urls
+        return [
+            blob.generate_signed_url(version="v4", expiration=expiration, method="GET")
+            for blob in blobs
+        ]
 
     def get_job_artifacts(self, job_id: str) -> List[Dict[str, str]]:
         """
@@ -231,17 +304,19 @@ class GCSWriter:
         try:
             # List all objects in job directory
             job_prefix = f"jobs/{job_id}/"
-            blobs = self.client.list_blobs(self.bucket, prefix=job_prefix)
+            blobs = list(self.client.list_blobs(self.bucket, prefix=job_prefix))
 
-            # Delete each blob
-            for blob in blobs:
-                blob.delete()
+            # Delete in batched requests (GCS accepts up to 100 calls per batch)
+            for start in range(0, len(blobs), GCS_BATCH_SIZE):
+                with self.client.batch():
+                    for blob in blobs[start : start + GCS_BATCH_SIZE]:
+                        blob.delete()
 
-            print(f"Deleted artifacts for job {job_id}")
+            logger.info(f"Deleted artifacts for job {job_id}")
             return True
 
         except Exception as e:
-            print(f"Error deleting artifacts for job {job_id}: {e}")
+            logger.error(f"Error deleting artifacts for job {job_id}: {e}")
             return False
 
     def write_job_summary(
@@ -283,10 +358,16 @@ class GCSWriter:
         return self.write_metrics_json(job_id, summary, "summary.json")
 
 
-# Global GCS writer instance
-gcs_writer = GCSWriter()
+# Global writer instance - initialize lazily
+_gcs_writer: Optional[GCSWriter] = None
+_gcs_writer_lock = threading.Lock()
 
 
 def get_gcs_writer() -> GCSWriter:
     """Get GCS writer instance."""
-    return gcs_writer
+    global _gcs_writer
+    if _gcs_writer is None:
+        with _gcs_writer_lock:
+            if _gcs_writer is None:
+                _gcs_writer = GCSWriter()
+    return _gcs_writer
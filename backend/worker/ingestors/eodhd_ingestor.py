@@ -7,12 +7,17 @@ Fetches end-of-day prices, corporate actions, and fundamentals from EODHD API.
 
 from __future__ import annotations
 
+import asyncio
+import io
 import os
 from datetime import datetime, timedelta
-from typing import List
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
+import httpx
 import pandas as pd
-import requests
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.cloud import bigquery, secretmanager
 
 # Configure logging
@@ -21,6 +26,105 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Output schema for prices and corporate actions, applied with one
+# reindex + astype pass
+_PRICE_COLUMNS = [
+    "date",
+    "symbol",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "adjusted_close",
+    "vendor",
+    "created_at",
+]
+_PRICE_DTYPES = {
+    "date": "datetime64[ns]",
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "Int64",
+    "adjusted_close": "float64",
+}
+_CORP_ACTION_COLUMNS = [
+    "date",
+    "symbol",
+    "amount",
+    "currency",
+    "action_type",
+    "vendor",
+    "created_at",
+]
+_CORP_ACTION_DTYPES = {"date": "datetime64[ns]", "amount": "float64"}
+
+# BigQuery load schemas for the standardized frames, as (name, type) pairs.
+# The matching Arrow schema is derived from the same list so the two never
+# drift apart
+_PRICE_FIELDS = [
+    ("date", "DATETIME"),
+    ("symbol", "STRING"),
+    ("open", "FLOAT64"),
+    ("high", "FLOAT64"),
+    ("low", "FLOAT64"),
+    ("close", "FLOAT64"),
+    ("volume", "INT64"),
+    ("adjusted_close", "FLOAT64"),
+    ("vendor", "STRING"),
+    ("created_at", "DATETIME"),
+]
+_CORP_ACTION_FIELDS = [
+    ("date", "DATETIME"),
+    ("symbol", "STRING"),
+    ("amount", "FLOAT64"),
+    ("currency", "STRING"),
+    ("action_type", "STRING"),
+    ("vendor", "STRING"),
+    ("created_at", "DATETIME"),
+]
+_ARROW_TYPES = {
+    "DATETIME": pa.timestamp("us"),
+    "FLOAT64": pa.float64(),
+    "INT64": pa.int64(),
+    "STRING": pa.string(),
+}
+
+
+# Process-wide Secret Manager client, created on first lookup
+_secret_client: Optional[secretmanager.SecretManagerServiceClient] = None
+
+
+@lru_cache(maxsize=32)
+def _fetch_secret(project_id: str, secret_name: str) -> str:
+    """Fetch and decode the latest secret version, cached per process.
+
+    Failed lookups raise and are therefore not cached.
+    """
+    global _secret_client
+    if _secret_client is None:
+        _secret_client = secretmanager.SecretManagerServiceClient()
+
+    name = f"projects/{project_id}/secrets/{secret_name}/versions/latest"
+    response = _secret_client.access_secret_version(request={"name": name})
+    return response.payload.data.decode("UTF-8")
+
+
+def _concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate per-symbol frames, skipping the copy for a single frame.
+
+    Each frame comes from pd.DataFrame(json), so it already has a RangeIndex.
+    """
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True, copy=False)
+
+
+def _utc_now() -> pd.Timestamp:
+    """Current UTC time as a naive Timestamp (matches datetime.utcnow())."""
+    return pd.Timestamp.now(tz="UTC").tz_localize(None)
+
 
 class EODHDIngestor:
     """Ingestor for EOD Historical Data API."""
@@ -36,18 +140,40 @@ class EODHDIngestor:
 
         # Initialize clients
         self.bq_client = bigquery.Client(project=self.project_id)
-        self.secret_client = secretmanager.SecretManagerServiceClient()
 
         # Get API key from Secret Manager
         self.api_key = self._get_secret("EODHD_API_KEY")
         self.base_url = "https://eodhd.com/api"
 
+        # Exchange used for bulk price requests on symbols without a suffix
+        self.exchange = os.getenv("EODHD_EXCHANGE", "US")
+
+        # Upper bound on in-flight vendor requests per fetch
+        self.max_concurrency = int(os.getenv("EODHD_MAX_CONCURRENCY", "10"))
+
+        # HTTP client shared by all fetches, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _get_secret(self, secret_name: str) -> str:
-        """Get secret from Secret Manager."""
+        """Get secret from Secret Manager (memoized across ingestors)."""
         try:
-            name = f"projects/{self.project_id}/secrets/{secret_name}/versions/latest"
-            response = self.secret_client.access_secret_version(request={"name": name})
-            return response.payload.data.decode("UTF-8")
+            return _fetch_secret(self.project_id, secret_name)
         except Exception as e:
             logger.error(f"Failed to get secret {secret_name}: {e}")
             return os.getenv(secret_name, "")
@@ -56,141 +182,215 @@ class EODHDIngestor:
         self, symbols: List[str], start_date: str, end_date: str
     ) -> pd.DataFrame:
         """Fetch OHLCV prices for given symbols."""
-        all_data = []
-
-        async with requests.AsyncClient() as client:
-            for symbol in symbols:
-                try:
-                    url = f"{self.base_url}/eod/{symbol}"
-                    params = {
-                        "from": start_date,
-                        "to": end_date,
-                        "api_token": self.api_key,
-                        "fmt": "json",
-                    }
-
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-
-                    data = response.json()
-                    if data:
-                        df = pd.DataFrame(data)
-                        df["symbol"] = symbol
-                        df["vendor"] = "eodhd"
-                        df["created_at"] = datetime.utcnow()
-                        all_data.append(df)
-
-                    logger.info(f"Fetched {len(data)} records for {symbol}")
-
-                except Exception as e:
-                    logger.error(f"Failed to fetch prices for {symbol}: {e}")
-                    continue
+        client = self._get_client()
+        results = await self._gather_symbols(
+            symbols,
+            lambda symbol: self._fetch_prices_one(client, symbol, start_date, end_date),
+        )
 
+        all_data = [df for df in results if df is not None]
         if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
+            combined_df = _concat_frames(all_data)
+            # One ingestion timestamp for the whole batch, broadcast once
+            combined_df["created_at"] = _utc_now()
             return self._standardize_prices(combined_df)
         return pd.DataFrame()
 
-    def _standardize_prices(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize price data format."""
-        # Rename columns to match our schema
-        column_mapping = {
-            "date": "date",
-            "open": "open",
-            "high": "high",
-            "low": "low",
-            "close": "close",
-            "volume": "volume",
-            "adjusted_close": "adjusted_close",
+    async def _fetch_prices_one(
+        self, client: httpx.AsyncClient, symbol: str, start_date: str, end_date: str
+    ) -> Optional[pd.DataFrame]:
+        """Fetch OHLCV prices for a single symbol, None on failure or no data."""
+        try:
+            url = f"{self.base_url}/eod/{symbol}"
+            params = {
+                "from": start_date,
+                "to": end_date,
+                "api_token": self.api_key,
+                "fmt": "json",
+            }
+
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+
+            data = response.json()
+            logger.info(f"Fetched {len(data)} records for {symbol}")
+            if not data:
+                return None
+
+            df = pd.DataFrame(data)
+            df["symbol"] = symbol
+            df["vendor"] = "eodhd"
+            return df
+
+        except Exception as e:
+            logger.error(f"Failed to fetch prices for {symbol}: {e}")
+            return None
+
+    async def fetch_prices_bulk(self, symbols: List[str], date: str) -> pd.DataFrame:
+        """Fetch one day of OHLCV prices with one bulk request per exchange."""
+        # Group symbols by their exchange suffix (e.g. "VOD.LSE" -> "LSE");
+        # bare tickers fall back to the configured default exchange
+        symbols_by_exchange: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            code, _, exchange = symbol.rpartition(".")
+            if not code:
+                exchange = self.exchange
+            symbols_by_exchange.setdefault(exchange, []).append(symbol)
+
+        frames = await asyncio.gather(
+            *(
+                self._fetch_prices_bulk_one(exchange, exchange_symbols, date)
+                for exchange, exchange_symbols in symbols_by_exchange.items()
+            )
+        )
+        all_data = [frame for frame in frames if not frame.empty]
+        df = _concat_frames(all_data) if all_data else pd.DataFrame()
+
+        returned = set(df["symbol"]) if not df.empty else set()
+        missing = [symbol for symbol in symbols if symbol not in returned]
+        if missing:
+            logger.warning(
+                f"Bulk prices for {date} missing {len(missing)} symbols: "
+                f"{', '.join(missing)}"
+            )
+        return df
+
+    async def _fetch_prices_bulk_one(
+        self, exchange: str, symbols: List[str], date: str
+    ) -> pd.DataFrame:
+        """Fetch one day of prices for the symbols listed on one exchange."""
+        # The bulk endpoint returns bare tickers in "code"; map them back to
+        # the symbols as requested (e.g. "AAPL" -> "AAPL.US"). Codes are only
+        # unique within an exchange, so the map is built per exchange
+        symbol_by_code = {
+            symbol.rpartition(".")[0] or symbol: symbol for symbol in symbols
         }
 
-        df = df.rename(columns=column_mapping)
-
-        # Ensure required columns exist
-        required_columns = [
-            "date",
-            "symbol",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "adjusted_close",
-        ]
-        for col in required_columns:
-            if col not in df.columns:
-                if col == "adjusted_close":
-                    df[col] = df["close"]
-                else:
-                    df[col] = None
-
-        # Convert date to datetime
-        df["date"] = pd.to_datetime(df["date"])
-
-        return df[required_columns + ["vendor", "created_at"]]
+        try:
+            url = f"{self.base_url}/eod-bulk-last-day/{exchange}"
+            params = {
+                "symbols": ",".join(symbol_by_code),
+                "date": date,
+                "api_token": self.api_key,
+                "fmt": "json",
+            }
+
+            response = await self._get_client().get(url, params=params)
+            response.raise_for_status()
+
+            data = response.json()
+            logger.info(f"Fetched {len(data)} bulk records for {exchange} on {date}")
+            if not data:
+                return pd.DataFrame()
 
-    async def fetch_corporate_actions(self, symbols: List[str]) -> pd.DataFrame:
-        """Fetch corporate actions for given symbols."""
-        all_data = []
+        except Exception as e:
+            logger.error(f"Failed to fetch bulk prices for {exchange}: {e}")
+            return pd.DataFrame()
 
-        async with requests.AsyncClient() as client:
-            for symbol in symbols:
-                try:
-                    url = f"{self.base_url}/div/{symbol}"
-                    params = {"api_token": self.api_key, "fmt": "json"}
+        df = pd.DataFrame(data)
+        df["symbol"] = df["code"].map(symbol_by_code)
+        df["vendor"] = "eodhd"
+        df["created_at"] = _utc_now()
+        return self._standardize_prices(df[df["symbol"].notna()])
 
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
+    async def _gather_symbols(
+        self,
+        symbols: List[str],
+        fetch_one: Callable[[str], Awaitable[Optional[pd.DataFrame]]],
+    ) -> List[Optional[pd.DataFrame]]:
+        """Run fetch_one for every symbol concurrently, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-                    data = response.json()
-                    if data:
-                        df = pd.DataFrame(data)
-                        df["symbol"] = symbol
-                        df["vendor"] = "eodhd"
-                        df["created_at"] = datetime.utcnow()
-                        all_data.append(df)
+        async def bounded(symbol: str) -> Optional[pd.DataFrame]:
+            async with semaphore:
+                return await fetch_one(symbol)
 
-                    logger.info(f"Fetched {len(data)} corporate actions for {symbol}")
+        return await asyncio.gather(*(bounded(symbol) for symbol in symbols))
 
-                except Exception as e:
-                    logger.error(f"Failed to fetch corporate actions for {symbol}: {e}")
-                    continue
+    def _standardize_prices(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Standardize price data format."""
+        # Select/create the schema columns in one pass; missing ones become NaN
+        df = df.reindex(columns=_PRICE_COLUMNS)
+        df["adjusted_close"] = df["adjusted_close"].fillna(df["close"])
 
+        return df.astype(_PRICE_DTYPES)
+
+    async def fetch_corporate_actions(self, symbols: List[str]) -> pd.DataFrame:
+        """Fetch corporate actions for given symbols."""
+        client = self._get_client()
+        results = await self._gather_symbols(
+            symbols,
+            lambda symbol: self._fetch_corporate_actions_one(client, symbol),
+        )
+
+        all_data = [df for df in results if df is not None]
         if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
+            combined_df = _concat_frames(all_data)
+            combined_df["created_at"] = _utc_now()
             return self._standardize_corporate_actions(combined_df)
         return pd.DataFrame()
 
-    def _standardize_corporate_actions(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize corporate actions data format."""
-        # Rename columns to match our schema
-        column_mapping = {
-            "date": "date",
-            "amount": "amount",
-            "currency": "currency",
-            "type": "action_type",
-        }
+    async def _fetch_corporate_actions_one(
+        self, client: httpx.AsyncClient, symbol: str
+    ) -> Optional[pd.DataFrame]:
+        """Fetch corporate actions for a single symbol, None on failure or no data."""
+        try:
+            url = f"{self.base_url}/div/{symbol}"
+            params = {"api_token": self.api_key, "fmt": "json"}
 
-        df = df.rename(columns=column_mapping)
+            response = await client.get(url, params=params)
+            response.raise_for_status()
 
-        # Ensure required columns exist
-        required_columns = ["date", "symbol", "amount", "currency", "action_type"]
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = None
+            data = response.json()
+            logger.info(f"Fetched {len(data)} corporate actions for {symbol}")
+            if not data:
+                return None
 
-        # Convert date to datetime
-        df["date"] = pd.to_datetime(df["date"])
+            df = pd.DataFrame(data)
+            df["symbol"] = symbol
+            df["vendor"] = "eodhd"
+            return df
 
-        return df[required_columns + ["vendor", "created_at"]]
+        except Exception as e:
+            logger.error(f"Failed to fetch corporate actions for {symbol}: {e}")
+            return None
 
-    def load_to_bigquery(self, df: pd.DataFrame, table_name: str) -> bool:
-        """Load data to BigQuery."""
+    def _standardize_corporate_actions(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Standardize corporate actions data format."""
+        # Rename in place (the combined frame is ours), then select/create
+        # the schema columns in one reindex
+        df.rename(columns={"type": "action_type"}, inplace=True)
+        df = df.reindex(columns=_CORP_ACTION_COLUMNS)
+
+        return df.astype(_CORP_ACTION_DTYPES)
+
+    def load_to_bigquery(
+        self, df: pd.DataFrame, table_name: str, fields: List[Tuple[str, str]]
+    ) -> bool:
+        """Load data to BigQuery as Parquet with an explicit schema."""
         try:
             table_id = f"{self.project_id}.{self.dataset_raw}.{table_name}"
 
+            # Convert with a fixed Arrow schema (no dtype inference) and write
+            # Parquet into memory; safe=False truncates created_at to the
+            # microsecond precision BigQuery stores
+            arrow_schema = pa.schema(
+                [(name, _ARROW_TYPES[field_type]) for name, field_type in fields]
+            )
+            table = pa.Table.from_pandas(
+                df, schema=arrow_schema, preserve_index=False, safe=False
+            )
+            buf = io.BytesIO()
+            pq.write_table(table, buf, compression="snappy")
+            buf.seek(0)
+
             # Configure load job
             job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.PARQUET,
+                schema=[
+                    bigquery.SchemaField(name, field_type)
+                    for name, field_type in fields
+                ],
                 write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
                 schema_update_options=[
                     bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION
@@ -198,8 +398,8 @@ class EODHDIngestor:
             )
 
             # Load data
-            job = self.bq_client.load_table_from_dataframe(
-                df, table_id, job_config=job_config
+            job = self.bq_client.load_table_from_file(
+                buf, table_id, job_config=job_config
             )
             job.result()  # Wait for job to complete
 
@@ -210,19 +410,42 @@ class EODHDIngestor:
             logger.error(f"Failed to load data to BigQuery: {e}")
             return False
 
+    async def _ingest(
+        self,
+        fetch: Awaitable[pd.DataFrame],
+        table_name: str,
+        fields: List[Tuple[str, str]],
+    ) -> bool:
+        """Await one dataset's fetch, then load it off the event loop."""
+        df = await fetch
+        if df.empty:
+            return False
+        return await asyncio.to_thread(self.load_to_bigquery, df, table_name, fields)
+
     async def run_ingestion(self, symbols: List[str], start_date: str, end_date: str):
         """Run complete ingestion process."""
         logger.info(f"Starting EODHD ingestion for {len(symbols)} symbols")
 
-        # Fetch and load prices
-        prices_df = await self.fetch_prices(symbols, start_date, end_date)
-        if not prices_df.empty:
-            self.load_to_bigquery(prices_df, self.table_eq)
+        # Prices: a single-day update needs one bulk request, a backfill
+        # needs full history per symbol
+        if start_date == end_date:
+            fetch_prices = self.fetch_prices_bulk(symbols, end_date)
+        else:
+            fetch_prices = self.fetch_prices(symbols, start_date, end_date)
 
-        # Fetch and load corporate actions
-        corp_actions_df = await self.fetch_corporate_actions(symbols)
-        if not corp_actions_df.empty:
-            self.load_to_bigquery(corp_actions_df, self.table_corp_actions)
+        # Prices and corporate actions are fetched and loaded concurrently;
+        # the blocking BigQuery loads run in worker threads
+        try:
+            await asyncio.gather(
+                self._ingest(fetch_prices, self.table_eq, _PRICE_FIELDS),
+                self._ingest(
+                    self.fetch_corporate_actions(symbols),
+                    self.table_corp_actions,
+                    _CORP_ACTION_FIELDS,
+                ),
+            )
+        finally:
+            await self.aclose()
 
         logger.info("EODHD ingestion completed")
 
@@ -240,6 +463,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
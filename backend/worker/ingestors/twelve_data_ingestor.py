@@ -7,13 +7,31 @@ Fetches intraday prices, FX rates, and crypto data from Twelve Data API.
 
 from __future__ import annotations
 
+import asyncio
+import io
 import os
+import random
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import List
-
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import httpx
+import numpy as np
 import pandas as pd
-import requests
-from google.cloud import bigquery, secretmanager
+import pyarrow as pa
+import pyarrow.parquet as pq
+from google.cloud import bigquery, secretmanager, storage
 
 # Configure logging
 import logging
@@ -21,6 +39,191 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# HTTP statuses worth retrying (rate limited or transient server errors)
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_MAX_BACKOFF_SECONDS = 60.0
+
+
+# Output schemas for the standardized frames. Equities and crypto carry
+# volume, FX pairs do not
+_RENAME = {"datetime": "date"}
+_OHLCV_NUMERIC = ["open", "high", "low", "close", "volume"]
+_OHLCV_COLUMNS = ["date", "symbol", *_OHLCV_NUMERIC, "interval", "vendor", "created_at"]
+_FX_NUMERIC = ["open", "high", "low", "close"]
+_FX_COLUMNS = ["date", "symbol", *_FX_NUMERIC, "interval", "vendor", "created_at"]
+
+# Low-cardinality string columns are stored as categoricals. Categories
+# are inferred from the data (not a fixed list), so an interval the vendor
+# adds later is kept rather than silently turned into NaN
+_CATEGORY_DTYPES = {
+    "symbol": "category",
+    "interval": "category",
+    "vendor": pd.CategoricalDtype(["twelvedata"]),
+}
+
+
+# BigQuery load schemas as (name, type) pairs; the matching Arrow schema is
+# derived from the same tuple (and cached). Crypto volume is fractional
+_ARROW_TYPES = {
+    "DATETIME": pa.timestamp("us"),
+    "FLOAT64": pa.float64(),
+    "INT64": pa.int64(),
+    "STRING": pa.string(),
+}
+_OHLC_FIELDS = (
+    ("date", "DATETIME"),
+    ("symbol", "STRING"),
+    ("open", "FLOAT64"),
+    ("high", "FLOAT64"),
+    ("low", "FLOAT64"),
+    ("close", "FLOAT64"),
+)
+_META_FIELDS = (
+    ("interval", "STRING"),
+    ("vendor", "STRING"),
+    ("created_at", "DATETIME"),
+)
+_EQ_FIELDS = (*_OHLC_FIELDS, ("volume", "INT64"), *_META_FIELDS)
+_FX_FIELDS = (*_OHLC_FIELDS, *_META_FIELDS)
+_CRYPTO_FIELDS = (*_OHLC_FIELDS, ("volume", "FLOAT64"), *_META_FIELDS)
+
+
+# time_series accepts up to 120 comma-separated symbols per request
+_MAX_SYMBOLS_PER_REQUEST = 120
+
+# Fields read from each time_series value; all but datetime are numeric
+_SERIES_NUMERIC = ("open", "high", "low", "close", "volume")
+
+
+def _to_float(raw: List[Any]) -> np.ndarray:
+    """Parse numeric strings straight to float64, coercing bad values to NaN."""
+    try:
+        return np.asarray(raw, dtype=np.float64)
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(raw), errors="coerce").to_numpy(np.float64)
+
+
+def _values_to_columns(
+    values: List[Dict[str, Any]], symbol: str
+) -> Dict[str, np.ndarray]:
+    """Turn one symbol's time_series values into per-column arrays."""
+    columns = {
+        "symbol": np.full(len(values), symbol, dtype=object),
+        "datetime": np.array([row.get("datetime") for row in values], dtype=object),
+    }
+    for field in _SERIES_NUMERIC:
+        # FX pairs have no volume
+        if field in values[0]:
+            columns[field] = _to_float([row.get(field) for row in values])
+    return columns
+
+
+# Process-wide Secret Manager client, created on first lookup
+_secret_client: Optional[secretmanager.SecretManagerServiceClient] = None
+
+
+@lru_cache(maxsize=8)
+def _fetch_secret(project_id: str, secret_name: str) -> str:
+    """Fetch and decode the latest secret version, cached per process.
+
+    Failed lookups raise and are therefore not cached.
+    """
+    global _secret_client
+    if _secret_client is None:
+        _secret_client = secretmanager.SecretManagerServiceClient()
+
+    name = f"projects/{project_id}/secrets/{secret_name}/versions/latest"
+    response = _secret_client.access_secret_version(request={"name": name})
+    return response.payload.data.decode("UTF-8")
+
+
+def _utc_now() -> pd.Timestamp:
+    """Current UTC time as a naive Timestamp (matches datetime.utcnow())."""
+    return pd.Timestamp.now(tz="UTC").tz_localize(None)
+
+
+def _chunks(df: pd.DataFrame, n: int) -> Iterator[pd.DataFrame]:
+    """Yield consecutive row slices of at most ``n`` rows."""
+    for start in range(0, len(df), n):
+        yield df.iloc[start : start + n]
+
+
+@lru_cache(maxsize=None)
+def _arrow_schema(fields: Tuple[Tuple[str, str], ...]) -> pa.Schema:
+    """Arrow schema matching a BigQuery (name, type) field tuple."""
+    return pa.schema([(name, _ARROW_TYPES[field_type]) for name, field_type in fields])
+
+
+def _standardize(
+    df: pd.DataFrame, columns: List[str], numeric_columns: List[str]
+) -> pd.DataFrame:
+    """Rename, reindex and type a raw Twelve Data frame to ``columns``."""
+    # Rename in place (the frame was just built by the caller), then
+    # select/create the output columns in one reindex; missing columns
+    # become NaN
+    df.rename(columns=_RENAME, inplace=True)
+    df = df.reindex(columns=columns)
+
+    # Convert date to datetime; ISO8601 skips per-row format inference
+    # and accepts both "YYYY-MM-DD" and "YYYY-MM-DD HH:MM:SS" bars
+    df["date"] = pd.to_datetime(df["date"], format="ISO8601")
+
+    # Numeric values were parsed to float64 when the response was read, so
+    # this cast only pins the dtype of any all-missing column
+    return df.astype({**dict.fromkeys(numeric_columns, "float64"), **_CATEGORY_DTYPES})
+
+
+class _TokenBucket:
+    """Async token bucket allowing ``rate`` API credits per ``period`` seconds."""
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.capacity = rate
+        self.tokens = rate
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, cost: float = 1) -> None:
+        """Wait until ``cost`` tokens are available and take them."""
+        if cost > self.capacity:
+            raise ValueError(f"Cost {cost} exceeds bucket capacity {self.capacity}")
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.fill_rate
+                )
+                self.updated = now
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                await asyncio.sleep((cost - self.tokens) / self.fill_rate)
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry ``attempt``: Retry-After if given, else
+    exponential backoff with jitter."""
+    if retry_after:
+        try:
+            return min(_MAX_BACKOFF_SECONDS, float(retry_after))
+        except ValueError:
+            pass
+    return min(_MAX_BACKOFF_SECONDS, 2**attempt + random.random())
+
 
 class TwelveDataIngestor:
     """Ingestor for Twelve Data API."""
@@ -35,18 +238,41 @@ class TwelveDataIngestor:
 
         # Initialize clients
         self.bq_client = bigquery.Client(project=self.project_id)
-        self.secret_client = secretmanager.SecretManagerServiceClient()
+
+        # Optional GCS bucket for staging Parquet files; when set, BigQuery
+        # loads read from GCS instead of an in-request upload
+        self.staging_bucket = os.getenv("INGEST_STAGING_BUCKET")
+        self.storage_client = (
+            storage.Client(project=self.project_id) if self.staging_bucket else None
+        )
+
+        # Rows per load job; bounds the Parquet buffer and what a retry resends
+        self.rows_per_batch = int(os.getenv("ROWS_PER_BATCH", "50000"))
 
         # Get API key from Secret Manager
         self.api_key = self._get_secret("TWELVE_DATA_API_KEY")
         self.base_url = "https://api.twelvedata.com"
 
+        # Upper bound on in-flight vendor requests per fetch
+        self.max_concurrency = int(os.getenv("TWELVE_DATA_MAX_CONCURRENCY", "16"))
+
+        # HTTP client shared by all fetches, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Stay under the plan's credit rate (8/s on the free tier; a batched
+        # request costs one credit per symbol) and retry rate-limited or
+        # failed requests with backoff
+        self._limiter = _TokenBucket(float(os.getenv("TWELVE_DATA_RATE_LIMIT", "8")))
+        # Batches never ask for more credits than the limiter can hold
+        self.symbols_per_request = max(
+            1, min(_MAX_SYMBOLS_PER_REQUEST, int(self._limiter.capacity))
+        )
+        self.max_retries = int(os.getenv("TWELVE_DATA_MAX_RETRIES", "5"))
+
     def _get_secret(self, secret_name: str) -> str:
-        """Get secret from Secret Manager."""
+        """Get secret from Secret Manager (memoized across ingestors)."""
         try:
-            name = f"projects/{self.project_id}/secrets/{secret_name}/versions/latest"
-            response = self.secret_client.access_secret_version(request={"name": name})
-            return response.payload.data.decode("UTF-8")
+            return _fetch_secret(self.project_id, secret_name)
         except Exception as e:
             logger.error(f"Failed to get secret {secret_name}: {e}")
             return os.getenv(secret_name, "")
@@ -59,8 +285,6 @@ class TwelveDataIngestor:
         end_date: str = None,
     ) -> pd.DataFrame:
         """Fetch OHLCV prices for given symbols."""
-        all_data = []
-
         # Set default dates if not provided
         if not end_date:
             end_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -69,276 +293,351 @@ class TwelveDataIngestor:
                 "%Y-%m-%d %H:%M:%S"
             )
 
-        async with requests.AsyncClient() as client:
-            for symbol in symbols:
-                try:
-                    url = f"{self.base_url}/time_series"
-                    params = {
-                        "symbol": symbol,
-                        "interval": interval,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "apikey": self.api_key,
-                        "format": "JSON",
-                    }
-
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-
-                    data = response.json()
-                    if data.get("status") == "ok" and data.get("values"):
-                        df = pd.DataFrame(data["values"])
-                        df["symbol"] = symbol
-                        df["interval"] = interval
-                        df["vendor"] = "twelvedata"
-                        df["created_at"] = datetime.utcnow()
-                        all_data.append(df)
-
-                    logger.info(
-                        f"Fetched {len(data.get('values', []))} records for {symbol}"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Failed to fetch prices for {symbol}: {e}")
-                    continue
+        # One ingestion timestamp for the whole batch
+        created_at = _utc_now()
+        client = self._get_client()
+        results = await self._gather_batches(
+            symbols,
+            lambda batch: self._fetch_series_batch(
+                client,
+                batch,
+                interval,
+                "price",
+                {"start_date": start_date, "end_date": end_date},
+            ),
+        )
+
+        combined_df = self._combine_columns(results, interval, created_at)
+        if combined_df.empty:
+            return combined_df
+        return self._standardize_prices(combined_df)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return self._client
 
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
-            return self._standardize_prices(combined_df)
-        return pd.DataFrame()
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-    def _standardize_prices(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize price data format."""
-        # Rename columns to match our schema
-        column_mapping = {
-            "datetime": "date",
-            "open": "open",
-            "high": "high",
-            "low": "low",
-            "close": "close",
-            "volume": "volume",
-        }
-
-        df = df.rename(columns=column_mapping)
-
-        # Ensure required columns exist
-        required_columns = [
-            "date",
-            "symbol",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "interval",
-        ]
-        for col in required_columns:
-            if col not in df.columns:
-                if col == "adjusted_close":
-                    df[col] = df["close"]
-                else:
-                    df[col] = None
+    async def _fetch_series_batch(
+        self,
+        client: httpx.AsyncClient,
+        symbols: List[str],
+        interval: str,
+        kind: str,
+        extra_params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, np.ndarray]]:
+        """Fetch several symbols' time series in one request, as column
+        arrays per symbol with data. Empty on failure."""
+        try:
+            url = f"{self.base_url}/time_series"
+            params = {
+                "symbol": ",".join(symbols),
+                "interval": interval,
+                "apikey": self.api_key,
+                "format": "JSON",
+                **(extra_params or {}),
+            }
+
+            data = await self._get_json(client, url, params, cost=len(symbols))
+            if data.get("status") == "error":
+                raise ValueError(data.get("message", "error response"))
 
-        # Convert date to datetime
-        df["date"] = pd.to_datetime(df["date"])
+        except Exception as e:
+            logger.error(f"Failed to fetch {kind} data for {', '.join(symbols)}: {e}")
+            return []
+
+        # A single-symbol request returns the series itself; a batch returns
+        # a mapping of symbol -> series
+        series_by_symbol = {symbols[0]: data} if len(symbols) == 1 else data
+
+        results = []
+        for symbol in symbols:
+            series = series_by_symbol.get(symbol) or {}
+            values = series.get("values") if series.get("status") == "ok" else None
+            logger.info(f"Fetched {len(values or [])} {kind} records for {symbol}")
+            if values:
+                results.append(_values_to_columns(values, symbol))
+        return results
+
+    def _combine_columns(
+        self,
+        parts: List[Dict[str, np.ndarray]],
+        interval: str,
+        created_at: pd.Timestamp,
+    ) -> pd.DataFrame:
+        """Build one frame from every symbol's column arrays (no per-symbol
+        frames or concat), stamped with the batch's created_at."""
+        if not parts:
+            return pd.DataFrame()
+
+        names = dict.fromkeys(name for columns in parts for name in columns)
+        df = pd.DataFrame(
+            {
+                name: np.concatenate(
+                    [
+                        columns.get(name, np.full(len(columns["symbol"]), np.nan))
+                        for columns in parts
+                    ]
+                )
+                for name in names
+            },
+            copy=False,
+        )
+        df["interval"] = interval
+        df["vendor"] = "twelvedata"
+        df["created_at"] = created_at
+        return df
+
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Dict[str, Any],
+        cost: int = 1,
+    ) -> Dict[str, Any]:
+        """GET a JSON payload under the rate limiter, retrying 429/5xx.
+
+        ``cost`` is the request's API credits (one per symbol requested).
+        """
+        for attempt in range(self.max_retries + 1):
+            await self._limiter.acquire(cost)
+            response = await client.get(url, params=params)
+
+            retry_after = response.headers.get("Retry-After")
+            retryable = response.status_code in _RETRY_STATUSES
+            if not retryable and response.is_success:
+                data = (
+                    orjson.loads(response.content)
+                    if ORJSON_AVAILABLE
+                    else response.json()
+                )
+                # Twelve Data also reports rate limiting as a 200 error body
+                retryable = data.get("status") == "error" and data.get("code") == 429
+                if not retryable:
+                    return data
+
+            if not retryable or attempt == self.max_retries:
+                response.raise_for_status()
+                return data
+
+            delay = _backoff_delay(attempt, retry_after)
+            logger.warning(
+                f"Retrying {params.get('symbol')} in {delay:.1f}s "
+                f"(attempt {attempt + 1}, status {response.status_code})"
+            )
+            await asyncio.sleep(delay)
 
-        # Convert string values to float
-        numeric_columns = ["open", "high", "low", "close", "volume"]
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+    async def _gather_batches(
+        self,
+        symbols: List[str],
+        fetch_batch: Callable[[List[str]], Awaitable[List[Dict[str, np.ndarray]]]],
+    ) -> List[Dict[str, np.ndarray]]:
+        """Split symbols into request-sized batches and run fetch_batch for
+        each concurrently, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(batch: List[str]) -> List[Dict[str, np.ndarray]]:
+            async with semaphore:
+                return await fetch_batch(batch)
+
+        size = self.symbols_per_request
+        batches = [
+            symbols[start : start + size] for start in range(0, len(symbols), size)
+        ]
+        results = await asyncio.gather(*(bounded(batch) for batch in batches))
+        return [columns for batch_results in results for columns in batch_results]
 
-        return df[required_columns + ["vendor", "created_at"]]
+    def _standardize_prices(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Standardize price data format."""
+        return _standardize(df, _OHLCV_COLUMNS, _OHLCV_NUMERIC)
 
     async def fetch_fx_rates(
         self, pairs: List[str], interval: str = "1h"
     ) -> pd.DataFrame:
         """Fetch FX rates for given currency pairs."""
-        all_data = []
-
-        async with requests.AsyncClient() as client:
-            for pair in pairs:
-                try:
-                    url = f"{self.base_url}/time_series"
-                    params = {
-                        "symbol": pair,
-                        "interval": interval,
-                        "apikey": self.api_key,
-                        "format": "JSON",
-                    }
-
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-
-                    data = response.json()
-                    if data.get("status") == "ok" and data.get("values"):
-                        df = pd.DataFrame(data["values"])
-                        df["symbol"] = pair
-                        df["interval"] = interval
-                        df["vendor"] = "twelvedata"
-                        df["created_at"] = datetime.utcnow()
-                        all_data.append(df)
-
-                    logger.info(
-                        f"Fetched {len(data.get('values', []))} FX records for {pair}"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Failed to fetch FX rates for {pair}: {e}")
-                    continue
-
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
-            return self._standardize_fx_data(combined_df)
-        return pd.DataFrame()
+        # One ingestion timestamp for the whole batch
+        created_at = _utc_now()
+        client = self._get_client()
+        results = await self._gather_batches(
+            pairs,
+            lambda batch: self._fetch_series_batch(client, batch, interval, "FX"),
+        )
+
+        combined_df = self._combine_columns(results, interval, created_at)
+        if combined_df.empty:
+            return combined_df
+        return self._standardize_fx_data(combined_df)
 
     def _standardize_fx_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize FX data format."""
-        # Rename columns to match our schema
-        column_mapping = {
-            "datetime": "date",
-            "open": "open",
-            "high": "high",
-            "low": "low",
-            "close": "close",
-        }
-
-        df = df.rename(columns=column_mapping)
-
-        # Ensure required columns exist
-        required_columns = [
-            "date",
-            "symbol",
-            "open",
-            "high",
-            "low",
-            "close",
-            "interval",
-        ]
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = None
-
-        # Convert date to datetime
-        df["date"] = pd.to_datetime(df["date"])
-
-        # Convert string values to float
-        numeric_columns = ["open", "high", "low", "close"]
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        return df[required_columns + ["vendor", "created_at"]]
+        return _standardize(df, _FX_COLUMNS, _FX_NUMERIC)
 
     async def fetch_crypto_data(
         self, symbols: List[str], interval: str = "1h"
     ) -> pd.DataFrame:
         """Fetch crypto data for given symbols."""
-        all_data = []
-
-        async with requests.AsyncClient() as client:
-            for symbol in symbols:
-                try:
-                    url = f"{self.base_url}/time_series"
-                    params = {
-                        "symbol": symbol,
-                        "interval": interval,
-                        "apikey": self.api_key,
-                        "format": "JSON",
-                    }
-
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-
-                    data = response.json()
-                    if data.get("status") == "ok" and data.get("values"):
-                        df = pd.DataFrame(data["values"])
-                        df["symbol"] = symbol
-                        df["interval"] = interval
-                        df["vendor"] = "twelvedata"
-                        df["created_at"] = datetime.utcnow()
-                        all_data.append(df)
-
-                    logger.info(
-                        f"Fetched {len(data.get('values', []))} crypto records "
-                        f"for {symbol}"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Failed to fetch crypto data for {symbol}: {e}")
-                    continue
-
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
-            return self._standardize_crypto_data(combined_df)
-        return pd.DataFrame()
+        # One ingestion timestamp for the whole batch
+        created_at = _utc_now()
+        client = self._get_client()
+        results = await self._gather_batches(
+            symbols,
+            lambda batch: self._fetch_series_batch(client, batch, interval, "crypto"),
+        )
+
+        combined_df = self._combine_columns(results, interval, created_at)
+        if combined_df.empty:
+            return combined_df
+        return self._standardize_crypto_data(combined_df)
 
     def _standardize_crypto_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize crypto data format."""
-        # Rename columns to match our schema
-        column_mapping = {
-            "datetime": "date",
-            "open": "open",
-            "high": "high",
-            "low": "low",
-            "close": "close",
-            "volume": "volume",
-        }
-
-        df = df.rename(columns=column_mapping)
-
-        # Ensure required columns exist
-        required_columns = [
-            "date",
-            "symbol",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "interval",
+        return _standardize(df, _OHLCV_COLUMNS, _OHLCV_NUMERIC)
+
+    def load_to_bigquery(
+        self, df: pd.DataFrame, table_name: str, fields: Tuple[Tuple[str, str], ...]
+    ) -> bool:
+        """Load data to BigQuery as Parquet with an explicit schema."""
+        return self._finish_loads(
+            self._submit_chunks(df, table_name, fields), table_name, fields
+        )
+
+    def _submit_chunks(
+        self, df: pd.DataFrame, table_name: str, fields: Tuple[Tuple[str, str], ...]
+    ) -> List[Tuple[pd.DataFrame, Optional[tuple]]]:
+        """Start one load job per ROWS_PER_BATCH rows, paired with its chunk."""
+        return [
+            (chunk, self._submit_load(chunk, table_name, fields))
+            for chunk in _chunks(df, self.rows_per_batch)
         ]
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = None
-
-        # Convert date to datetime
-        df["date"] = pd.to_datetime(df["date"])
 
-        # Convert string values to float
-        numeric_columns = ["open", "high", "low", "close", "volume"]
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        return df[required_columns + ["vendor", "created_at"]]
-
-    def load_to_bigquery(self, df: pd.DataFrame, table_name: str) -> bool:
-        """Load data to BigQuery."""
+    def _finish_loads(
+        self,
+        submitted: List[Tuple[pd.DataFrame, Optional[tuple]]],
+        table_name: str,
+        fields: Tuple[Tuple[str, str], ...],
+    ) -> bool:
+        """Wait for submitted chunk loads, retrying each failed chunk once as
+        two half-size loads. Returns True if every row was loaded."""
+        success = True
+        for chunk, load in submitted:
+            if load is not None and self._wait_for_load(*load):
+                continue
+
+            if len(chunk) < 2:
+                success = False
+                continue
+
+            logger.warning(f"Retrying {len(chunk)} rows for {table_name} in halves")
+            half = (len(chunk) + 1) // 2
+            for part in (chunk.iloc[:half], chunk.iloc[half:]):
+                retry = self._submit_load(part, table_name, fields)
+                if retry is None or not self._wait_for_load(*retry):
+                    success = False
+
+        return success
+
+    def _submit_load(
+        self, df: pd.DataFrame, table_name: str, fields: Tuple[Tuple[str, str], ...]
+    ) -> Optional[Tuple[bigquery.LoadJob, Optional[storage.Blob], int]]:
+        """Start a Parquet load job without waiting for it.
+
+        Returns (job, staged blob or None, row count), or None if the job
+        could not be started.
+        """
         try:
             table_id = f"{self.project_id}.{self.dataset_raw}.{table_name}"
 
+            # Convert once with the table's Arrow schema and write Parquet into
+            # memory; safe=False truncates created_at to microseconds
+            table = pa.Table.from_pandas(
+                df, schema=_arrow_schema(fields), preserve_index=False, safe=False
+            )
+            buf = io.BytesIO()
+            pq.write_table(table, buf, compression="snappy")
+            buf.seek(0)
+
             # Configure load job
             job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.PARQUET,
+                schema=[
+                    bigquery.SchemaField(name, field_type)
+                    for name, field_type in fields
+                ],
                 write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
                 schema_update_options=[
                     bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION
                 ],
             )
 
-            # Load data
-            job = self.bq_client.load_table_from_dataframe(
-                df, table_id, job_config=job_config
-            )
+            # Stage to GCS and load from the URI when a bucket is configured,
+            # otherwise upload the file with the load request
+            blob = None
+            if self.staging_bucket:
+                blob = self.storage_client.bucket(self.staging_bucket).blob(
+                    f"ingest/{table_name}/{uuid.uuid4().hex}.parquet"
+                )
+                blob.upload_from_file(
+                    buf, rewind=True, content_type="application/octet-stream"
+                )
+                job = self.bq_client.load_table_from_uri(
+                    f"gs://{self.staging_bucket}/{blob.name}",
+                    table_id,
+                    job_config=job_config,
+                )
+            else:
+                job = self.bq_client.load_table_from_file(
+                    buf, table_id, job_config=job_config
+                )
+
+            return job, blob, len(df)
+
+        except Exception as e:
+            logger.error(f"Failed to load data to BigQuery: {e}")
+            return None
+
+    def _wait_for_load(
+        self, job: bigquery.LoadJob, blob: Optional[storage.Blob], rows: int
+    ) -> bool:
+        """Wait for a submitted load job, then remove its staged file."""
+        try:
             job.result()  # Wait for job to complete
 
-            logger.info(f"Successfully loaded {len(df)} rows to {table_id}")
+            logger.info(f"Successfully loaded {rows} rows to {job.destination}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to load data to BigQuery: {e}")
             return False
 
+        finally:
+            if blob is not None:
+                try:
+                    blob.delete()
+                except Exception as e:
+                    logger.warning(f"Failed to delete staged file {blob.name}: {e}")
+
+    async def _ingest(
+        self,
+        fetch: Awaitable[pd.DataFrame],
+        table_name: str,
+        fields: Tuple[Tuple[str, str], ...],
+    ) -> bool:
+        """Await one dataset's fetch, then load it off the event loop."""
+        df = await fetch
+        if df.empty:
+            return False
+        return await asyncio.to_thread(self.load_to_bigquery, df, table_name, fields)
+
     async def run_ingestion(
         self,
         symbols: List[str] = None,
@@ -357,23 +656,35 @@ class TwelveDataIngestor:
         if not crypto_symbols:
             crypto_symbols = ["BTC/USD", "ETH/USD"]
 
-        # Fetch and load equity prices
+        # Each dataset is fetched and then loaded in a worker thread, and the
+        # three pipelines run concurrently so a blocking BigQuery load never
+        # stalls the event loop or the other fetches
+        pipelines = []
         if symbols:
-            prices_df = await self.fetch_prices(symbols, interval)
-            if not prices_df.empty:
-                self.load_to_bigquery(prices_df, self.table_eq)
-
-        # Fetch and load FX rates
+            pipelines.append(
+                self._ingest(
+                    self.fetch_prices(symbols, interval), self.table_eq, _EQ_FIELDS
+                )
+            )
         if fx_pairs:
-            fx_df = await self.fetch_fx_rates(fx_pairs, interval)
-            if not fx_df.empty:
-                self.load_to_bigquery(fx_df, self.table_fx)
-
-        # Fetch and load crypto data
+            pipelines.append(
+                self._ingest(
+                    self.fetch_fx_rates(fx_pairs, interval), self.table_fx, _FX_FIELDS
+                )
+            )
         if crypto_symbols:
-            crypto_df = await self.fetch_crypto_data(crypto_symbols, interval)
-            if not crypto_df.empty:
-                self.load_to_bigquery(crypto_df, self.table_crypto)
+            pipelines.append(
+                self._ingest(
+                    self.fetch_crypto_data(crypto_symbols, interval),
+                    self.table_crypto,
+                    _CRYPTO_FIELDS,
+                )
+            )
+
+        try:
+            await asyncio.gather(*pipelines)
+        finally:
+            await self.aclose()
 
         logger.info("Twelve Data ingestion completed")
 
@@ -391,6 +702,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
+    # The ingestor is all event-loop work (HTTP fan-out, retries), so run
+    # it on uvloop when installed
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
@@ -1,25 +1,30 @@
 from __future__ import annotations
 
 import base64
-import json
+import logging
 import os
 import uuid
 from datetime import datetime
 from typing import Any, Dict
 
+import orjson
 import pandas as pd
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from bq import get_bq_loader
 from gcs import get_gcs_writer
 from models import run_model
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Create FastAPI app
 app = FastAPI(
     title="Quant Finance Platform Worker",
     description="Worker service for processing async financial modeling jobs",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -62,7 +67,7 @@ async def process_pubsub_message(request: Request):
             )
 
         # Get request body
-        body = await request.json()
+        body = orjson.loads(await request.body())
 
         # Extract message data
         message = body.get("message", {})
@@ -75,8 +80,8 @@ async def process_pubsub_message(request: Request):
 
         # Decode base64 message
         try:
-            decoded_data = base64.b64decode(data).decode("utf-8")
-            job_data = json.loads(decoded_data)
+            # orjson parses (and UTF-8 validates) the decoded bytes directly
+            job_data = orjson.loads(base64.b64decode(data))
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -87,7 +92,7 @@ async def process_pubsub_message(request: Request):
         await process_job(job_data)
 
         # Acknowledge message
-        return JSONResponse(
+        return ORJSONResponse(
             content={"status": "processed", "job_id": job_data.get("job_id")},
             status_code=200,
         )
@@ -95,7 +100,7 @@ async def process_pubsub_message(request: Request):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error processing Pub/Sub message: {e}")
+        logger.error(f"Error processing Pub/Sub message: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}",
@@ -122,7 +127,7 @@ async def process_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
     adjusted = job_data.get("adjusted", True)
     params = job_data.get("params", {})
 
-    print(f"Processing job {job_id}: {job_type} for symbols {symbols}")
+    logger.info(f"Processing job {job_id}: {job_type} for symbols {symbols}")
 
     try:
         # Load data from BigQuery
@@ -136,7 +141,7 @@ async def process_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
             vendor=vendor,
         )
 
-        print(f"Loaded {len(prices_df)} price records for {len(symbols)} symbols")
+        logger.info(f"Loaded {len(prices_df)} price records for {len(symbols)} symbols")
 
         # Run the financial model
         model_results = run_model(job_type, params, prices_df)
@@ -157,20 +162,26 @@ async def process_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
             )
             artifacts.append(prices_path)
 
-        # Write model-specific artifacts
+        # Write model-specific artifacts (Monte Carlo paths are only present
+        # when the job asked for them with return_paths)
         if job_type == "montecarlo" and "paths" in model_results:
-            # Convert paths to DataFrame
-            paths_df = pd.DataFrame(model_results["paths"])
-            paths_path = gcs_writer.write_artifact_dataframe(
-                job_id, paths_df, "simulation_paths", "csv"
+            # Paths are a (time_steps + 1, simulations) array; write them
+            # to Parquet with one row per simulation and one column per time
+            # step (t0..tT), so the schema stays narrow as simulations grow
+            paths = model_results["paths"].T
+            paths_path = gcs_writer.write_artifact_array(
+                job_id,
+                paths,
+                "simulation_paths",
+                column_names=[f"t{i}" for i in range(paths.shape[1])],
             )
             artifacts.append(paths_path)
 
         elif job_type == "markowitz" and "weights" in model_results:
             # Write weights
-            weights_df = pd.DataFrame(model_results["weights"])
+            weights_df = pd.DataFrame.from_records(model_results["weights"])
             weights_path = gcs_writer.write_artifact_dataframe(
-                job_id, weights_df, "portfolio_weights", "csv"
+                job_id, weights_df, "portfolio_weights", "parquet"
             )
             artifacts.append(weights_path)
 
@@ -188,7 +199,7 @@ async def process_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
         # Generate signed URLs
         signed_urls = gcs_writer.generate_signed_urls(job_id)
 
-        print(
+        logger.info(
             f"Job {job_id} completed successfully. "
             f"Generated {len(artifacts)} artifacts."
         )
@@ -202,7 +213,7 @@ async def process_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Error processing job {job_id}: {e}")
+        logger.error(f"Error processing job {job_id}: {e}")
 
         # Write error to GCS
         try:
@@ -214,7 +225,7 @@ async def process_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
             }
             gcs_writer.write_metrics_json(job_id, error_data, "error.json")
         except Exception as gcs_error:
-            print(f"Failed to write error to GCS: {gcs_error}")
+            logger.error(f"Failed to write error to GCS: {gcs_error}")
 
         raise
 
@@ -257,4 +268,4 @@ if __name__ == "__main__":
     import uvicorn
 
     port = int(os.getenv("PORT", 8080))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(app, host="0.0.0.0", port=port, loop="uvloop", http="httptools")
@@ -1,19 +1,202 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+import hashlib
+import logging
+import math
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from scipy import stats
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+from scipy.special import ndtr, ndtri
 from scipy.optimize import minimize
 
+logger = logging.getLogger(__name__)
+
 try:
     from sklearn.covariance import LedoitWolf
 
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
-    print("Warning: scikit-learn not available. Ledoit-Wolf covariance disabled.")
+    logger.warning("scikit-learn not available. Ledoit-Wolf covariance disabled.")
+
+try:
+    import cupy as cp
+
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _gbm_paths_kernel(
+    drift: float, vol: float, n_steps: int, n_sims: int, seed: int, keep_paths: bool
+):
+    """Simulate GBM growth factors, one scalar walk per simulation.
+
+    Returns the final growth factor of every path and, if ``keep_paths``, the
+    full paths with one row per simulation (otherwise an empty array, so no
+    (n_sims, n_steps + 1) matrix is allocated). Path i is seeded with
+    seed * n_sims + i, so results do not depend on thread scheduling and
+    different seeds do not share paths.
+    """
+    finals = np.empty(n_sims)
+    paths = np.empty((n_sims if keep_paths else 0, n_steps + 1))
+    for i in prange(n_sims):
+        np.random.seed(seed * n_sims + i)
+        x = 1.0
+        if keep_paths:
+            paths[i, 0] = x
+        for t in range(n_steps):
+            x *= math.exp(drift + vol * np.random.standard_normal())
+            if keep_paths:
+                paths[i, t + 1] = x
+        finals[i] = x
+    return finals, paths
+
+
+if NUMBA_AVAILABLE:
+    _gbm_paths_kernel = njit(parallel=True, fastmath=True, cache=True)(
+        _gbm_paths_kernel
+    )
+
+
+_SQRT1_2 = 0.7071067811865476
+_INV_SQRT_2PI = 0.3989422804014327
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF via math.erfc (no scipy dispatch)."""
+    return 0.5 * math.erfc(-x * _SQRT1_2)
+
+
+def _bs_kernel(S: float, K: float, T: float, r: float, sigma: float, is_call: bool):
+    """Black-Scholes price and Greeks for one option, as a 6-tuple."""
+    sqrt_t = math.sqrt(T)
+    vol_sqrt_t = sigma * sqrt_t
+    d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+
+    # Shared terms, computed once: the density at d1 and the discounted
+    # strike; puts use N(-d) directly, which stays accurate in the tails
+    pdf_d1 = math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    discount = K * math.exp(-r * T)
+    time_decay = -S * pdf_d1 * sigma / (2 * sqrt_t)
+
+    if is_call:
+        nd1 = _norm_cdf(d1)
+        nd2 = _norm_cdf(d2)
+        price = S * nd1 - discount * nd2
+        delta = nd1
+        theta = time_decay - r * discount * nd2
+        rho = T * discount * nd2
+    else:  # put
+        n_minus_d1 = _norm_cdf(-d1)
+        n_minus_d2 = _norm_cdf(-d2)
+        price = discount * n_minus_d2 - S * n_minus_d1
+        delta = -n_minus_d1
+        theta = time_decay + r * discount * n_minus_d2
+        rho = -T * discount * n_minus_d2
+
+    # Greeks
+    gamma = pdf_d1 / (S * vol_sqrt_t)
+    vega = S * sqrt_t * pdf_d1
+
+    return price, delta, gamma, theta, vega, rho
+
+
+if NUMBA_AVAILABLE:
+    _norm_cdf = njit(cache=True, fastmath=True)(_norm_cdf)
+    _bs_kernel = njit(cache=True, fastmath=True)(_bs_kernel)
+
+
+def _black_scholes_vec(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray,
+    is_call: np.ndarray,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Black-Scholes price and Greeks over broadcast arrays.
+
+    Calls and puts share one pair of ndtr calls through a +1/-1 sign, so a
+    mixed chain is priced in a single pass.
+
+    Returns:
+        Tuple of arrays (price, delta, gamma, theta, vega, rho)
+    """
+    sqrt_t = np.sqrt(T)
+    vol_sqrt_t = sigma * sqrt_t
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+
+    sign = np.where(is_call, 1.0, -1.0)
+    n_d1 = ndtr(sign * d1)
+    n_d2 = ndtr(sign * d2)
+    pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    discount = K * np.exp(-r * T)
+
+    price = sign * (S * n_d1 - discount * n_d2)
+    delta = sign * n_d1
+    gamma = pdf_d1 / (S * vol_sqrt_t)
+    theta = -S * pdf_d1 * sigma / (2 * sqrt_t) - sign * r * discount * n_d2
+    vega = S * sqrt_t * pdf_d1
+    rho = sign * T * discount * n_d2
+
+    return price, delta, gamma, theta, vega, rho
+
+
+# Covariance estimates keyed by a digest of the returns data and the method;
+# jobs that re-run the same universe/window with different risk_aversion or
+# target_return reuse the estimate. Bounded LRU, oldest entries evicted first
+_COVARIANCE_CACHE: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+_COVARIANCE_CACHE_SIZE = 32
+
+
+def _ledoit_wolf_gpu(returns: np.ndarray) -> np.ndarray:
+    """
+    Ledoit-Wolf shrunk covariance computed on the GPU with CuPy.
+
+    Same estimator as sklearn's LedoitWolf (centered data, 1/n scaling,
+    shrinkage towards a scaled identity), so results match the CPU path.
+    """
+    X = cp.asarray(returns, dtype=cp.float64)
+    n_samples, n_features = X.shape
+    X -= X.mean(axis=0)
+
+    emp_cov = (X.T @ X) / n_samples
+    X2 = X * X
+    emp_cov_trace = X2.sum(axis=0) / n_samples
+    mu = float(emp_cov_trace.sum()) / n_features
+
+    # Sum of the coefficients of X2'X2 (= sum over samples of the squared
+    # row sums of X2) and of the squared coefficients of X'X / n
+    beta_ = float((X2.sum(axis=1) ** 2).sum())
+    delta_ = float((emp_cov**2).sum())
+
+    beta = (beta_ / n_samples - delta_) / (n_features * n_samples)
+    delta = (delta_ - 2.0 * mu * float(emp_cov_trace.sum()) + n_features * mu**2) / (
+        n_features
+    )
+    # Never shrink by more than 1
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta == 0 else beta / delta
+
+    shrunk = (1.0 - shrinkage) * emp_cov
+    shrunk[cp.diag_indices(n_features)] += shrinkage * mu
+    return cp.asnumpy(shrunk)
 
 
 class MonteCarloGBM:
@@ -24,6 +207,16 @@ class MonteCarloGBM:
         self.time_steps = params.get("time_steps", 252)
         self.risk_free_rate = params.get("risk_free_rate", 0.02)
         self.confidence_level = params.get("confidence_level", 0.95)
+        # Full paths are only materialized on request; metrics need only the
+        # final values
+        self.return_paths = params.get("return_paths", False)
+        self.seed = params.get("seed", 42)
+        # "pseudo": plain pseudo-random shocks; "antithetic": each draw is
+        # paired with its negation; "sobol": scrambled Sobol points (with
+        # antithetic pairs), for which simulations should be a power of two
+        self.rng_method = params.get("rng_method", "pseudo")
+        if self.rng_method not in ("pseudo", "antithetic", "sobol"):
+            raise ValueError(f"Unknown rng_method: {self.rng_method}")
 
     def simulate(self, returns: pd.Series) -> Dict[str, Any]:
         """
@@ -43,35 +236,20 @@ class MonteCarloGBM:
         mu_annual = mu * 252
         sigma_annual = sigma * np.sqrt(252)
 
-        # Generate random paths
+        # Simulate final values (and the full paths only when requested)
         dt = 1 / self.time_steps
-        paths = np.zeros((self.time_steps + 1, self.simulations))
-        paths[0] = 1.0  # Start at 1.0
-
-        # Generate random numbers
-        np.random.seed(42)  # For reproducibility
-        random_numbers = np.random.normal(0, 1, (self.time_steps, self.simulations))
-
-        # Simulate paths
-        for t in range(1, self.time_steps + 1):
-            drift = (mu_annual - 0.5 * sigma_annual**2) * dt
-            diffusion = sigma_annual * np.sqrt(dt) * random_numbers[t - 1]
-            paths[t] = paths[t - 1] * np.exp(drift + diffusion)
-
-        # Calculate final values
-        final_values = paths[-1]
+        drift = (mu_annual - 0.5 * sigma_annual**2) * dt
+        vol = sigma_annual * np.sqrt(dt)
+        final_values, paths = self._simulate_paths(drift, vol)
 
         # Calculate metrics
         mean_return = np.mean(final_values)
         std_return = np.std(final_values)
 
-        # Calculate percentiles
-        p5 = np.percentile(final_values, 5)
-        p50 = np.percentile(final_values, 50)
-        p95 = np.percentile(final_values, 95)
-
-        # Calculate VaR
-        var = np.percentile(final_values, (1 - self.confidence_level) * 100)
+        # Percentiles and VaR, all from a single partition of final_values
+        p5, p50, p95, var = np.quantile(
+            final_values, [0.05, 0.5, 0.95, 1 - self.confidence_level]
+        )
 
         # Calculate Sharpe ratio
         excess_returns = final_values - np.exp(self.risk_free_rate)
@@ -93,12 +271,79 @@ class MonteCarloGBM:
                 "simulations": self.simulations,
                 "time_steps": self.time_steps,
             },
-            "paths": paths.tolist(),
-            "final_values": final_values.tolist(),
+            "final_values": final_values,
         }
+        if paths is not None:
+            results["paths"] = paths
 
         return results
 
+    def _simulate_paths(
+        self, drift: float, vol: float
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Simulate growth paths with per-step log-return ``drift + vol * Z``.
+
+        Returns:
+            Final values of shape (simulations,) and, if ``return_paths``, the
+            paths of shape (time_steps + 1, simulations), else None
+        """
+        if NUMBA_AVAILABLE and self.rng_method == "pseudo":
+            # Compiled kernel fills one row per simulation; the transpose is
+            # a view in the (time_steps + 1, simulations) layout
+            finals, paths = _gbm_paths_kernel(
+                drift,
+                vol,
+                self.time_steps,
+                self.simulations,
+                self.seed,
+                self.return_paths,
+            )
+            return finals, (paths.T if self.return_paths else None)
+
+        random_numbers = self._draw_shocks()
+
+        # Log-prices are the cumulative sum of the per-step log-returns,
+        # built in place over the random draws
+        log_increments = random_numbers
+        log_increments *= vol
+        log_increments += drift
+        if not self.return_paths:
+            return np.exp(log_increments.sum(axis=0)), None
+        np.cumsum(log_increments, axis=0, out=log_increments)
+
+        paths = np.empty((self.time_steps + 1, self.simulations))
+        paths[0] = 1.0  # Start at 1.0
+        np.exp(log_increments, out=paths[1:])
+        return paths[-1], paths
+
+    def _draw_shocks(self) -> np.ndarray:
+        """Standard normal shocks of shape (time_steps, simulations)."""
+        if self.rng_method == "pseudo":
+            # Local PCG64 generator, seeded per call for reproducibility
+            # (no shared global RNG state)
+            rng = np.random.default_rng(self.seed)
+            return rng.standard_normal((self.time_steps, self.simulations))
+
+        # Draw half the simulations and mirror them (Z, -Z)
+        n_draw = (self.simulations + 1) // 2
+        if self.rng_method == "sobol":
+            # One Sobol dimension per time step; the inverse normal CDF maps
+            # the low-discrepancy points to Gaussian shocks. Sobol balance
+            # properties need a power-of-two sample size, so draw 2**m points
+            # and keep the first n_draw
+            sampler = stats.qmc.Sobol(d=self.time_steps, scramble=True, seed=self.seed)
+            m = (n_draw - 1).bit_length()
+            draws = ndtri(sampler.random_base2(m)[:n_draw]).T
+        else:
+            rng = np.random.default_rng(self.seed)
+            draws = rng.standard_normal((self.time_steps, n_draw))
+
+        shocks = np.empty((self.time_steps, self.simulations))
+        shocks[:, :n_draw] = draws
+        np.negative(draws[:, : self.simulations - n_draw], out=shocks[:, n_draw:])
+        return shocks
+
 
 class MarkowitzOptimizer:
     """Markowitz portfolio optimization."""
@@ -109,6 +354,8 @@ class MarkowitzOptimizer:
         self.max_weight = params.get("max_weight", 0.3)
         self.min_weight = params.get("min_weight", 0.0)
         self.covariance_method = params.get("covariance_method", "ledoit_wolf")
+        # Optional precomputed covariance matrix (skips estimation entirely)
+        self.covariance_matrix = params.get("covariance_matrix")
 
     def optimize(self, returns: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -124,55 +371,18 @@ class MarkowitzOptimizer:
         expected_returns = returns.mean() * 252  # Annualize
         cov_matrix = self._calculate_covariance(returns)
 
-        # Number of assets
-        n_assets = len(returns.columns)
-
-        # Initial weights (equal weight)
-        initial_weights = np.array([1.0 / n_assets] * n_assets)
-
-        # Constraints
-        constraints = [
-            {"type": "eq", "fun": lambda x: np.sum(x) - 1}  # Weights sum to 1
-        ]
-
-        if self.target_return is not None:
-            constraints.append(
-                {
-                    "type": "eq",
-                    "fun": lambda x: np.sum(expected_returns * x) - self.target_return,
-                }
-            )
-
-        # Bounds for weights
-        bounds = [(self.min_weight, self.max_weight)] * n_assets
-
-        # Objective function: minimize portfolio variance
-        def objective(weights):
-            portfolio_variance = np.dot(weights.T, np.dot(cov_matrix, weights))
-            portfolio_return = np.sum(expected_returns * weights)
-            # Add risk aversion penalty
-            return portfolio_variance - self.risk_aversion * portfolio_return
-
-        # Optimize
-        result = minimize(
-            objective,
-            initial_weights,
-            method="SLSQP",
-            bounds=bounds,
-            constraints=constraints,
-            options={"ftol": 1e-8, "maxiter": 1000},
-        )
-
-        if not result.success:
-            raise RuntimeError(f"Portfolio optimization failed: {result.message}")
-
-        optimal_weights = result.x
+        # Closed-form solution; the iterative solver is only needed when the
+        # weight bounds bind (or the covariance is not positive definite)
+        mu = expected_returns.to_numpy(dtype=np.float64)
+        analytic_weights = self._analytic_weights(mu, cov_matrix)
+        if analytic_weights is not None and self._within_bounds(analytic_weights):
+            optimal_weights = analytic_weights
+        else:
+            optimal_weights = self._solve_slsqp(mu, cov_matrix, analytic_weights)
 
         # Calculate portfolio metrics
-        portfolio_return = np.sum(expected_returns * optimal_weights)
-        portfolio_variance = np.dot(
-            optimal_weights.T, np.dot(cov_matrix, optimal_weights)
-        )
+        portfolio_return = mu @ optimal_weights
+        portfolio_variance = optimal_weights @ (cov_matrix @ optimal_weights)
         portfolio_volatility = np.sqrt(portfolio_variance)
 
         # Calculate Sharpe ratio
@@ -203,9 +413,168 @@ class MarkowitzOptimizer:
 
         return results
 
+    def _analytic_weights(
+        self, mu: np.ndarray, cov_matrix: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        Closed-form optimum under the equality constraints only (no bounds).
+
+        Minimizing w'Σw - λμ'w subject to 1'w = 1 (and μ'w = target) gives
+        w = Σ⁻¹(a1 + bμ); a and b follow from the constraints using
+        A = 1'Σ⁻¹1, B = 1'Σ⁻¹μ and C = μ'Σ⁻¹μ.
+
+        Returns:
+            Weights, or None if the covariance is not positive definite or
+            the target-return system is degenerate
+        """
+        try:
+            factor = cho_factor(cov_matrix)
+        except LinAlgError:
+            return None
+
+        inv_cov_ones = cho_solve(factor, np.ones_like(mu))
+        inv_cov_mu = cho_solve(factor, mu)
+        A = inv_cov_ones.sum()
+        B = inv_cov_mu.sum()
+
+        if self.target_return is None:
+            # Stationarity gives w = Σ⁻¹(λμ + ν1) / 2; ν enforces the budget
+            nu = (2 - self.risk_aversion * B) / A
+            return 0.5 * (self.risk_aversion * inv_cov_mu + nu * inv_cov_ones)
+
+        # With the return pinned, the objective's linear term is constant, so
+        # this is the minimum-variance portfolio for the target return
+        C = mu @ inv_cov_mu
+        delta = A * C - B * B
+        if delta <= 0:
+            return None
+        a = (C - B * self.target_return) / delta
+        b = (A * self.target_return - B) / delta
+        return a * inv_cov_ones + b * inv_cov_mu
+
+    def _within_bounds(self, weights: np.ndarray, tol: float = 1e-10) -> bool:
+        """Check weights against the per-asset bounds."""
+        return bool(
+            np.all(weights >= self.min_weight - tol)
+            and np.all(weights <= self.max_weight + tol)
+        )
+
+    def _solve_slsqp(
+        self,
+        mu: np.ndarray,
+        cov_matrix: np.ndarray,
+        start_weights: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Solve the bounded problem with SLSQP.
+
+        Args:
+            mu: Expected returns
+            cov_matrix: Covariance matrix
+            start_weights: Warm start (clipped to the bounds); equal weights
+                if None
+
+        Returns:
+            Optimal weights
+        """
+        n_assets = len(mu)
+
+        # Initial weights: the clipped analytic solution when available,
+        # otherwise equal weight
+        if start_weights is None:
+            initial_weights = np.full(n_assets, 1.0 / n_assets)
+        else:
+            initial_weights = np.clip(start_weights, self.min_weight, self.max_weight)
+
+        # Constraints, with their (constant) Jacobians
+        ones = np.ones(n_assets)
+        constraints = [
+            # Weights sum to 1
+            {"type": "eq", "fun": lambda x: x.sum() - 1, "jac": lambda x: ones}
+        ]
+
+        if self.target_return is not None:
+            constraints.append(
+                {
+                    "type": "eq",
+                    "fun": lambda x: mu @ x - self.target_return,
+                    "jac": lambda x: mu,
+                }
+            )
+
+        # Bounds for weights
+        bounds = [(self.min_weight, self.max_weight)] * n_assets
+
+        # Objective function: minimize portfolio variance with a risk aversion
+        # penalty; the exact gradient 2Σw - λμ reuses Σw and spares SLSQP
+        # the finite-difference objective evaluations
+        def objective_and_grad(weights):
+            cov_weights = cov_matrix @ weights
+            value = weights @ cov_weights - self.risk_aversion * (mu @ weights)
+            grad = 2 * cov_weights - self.risk_aversion * mu
+            return value, grad
+
+        # Optimize
+        result = minimize(
+            objective_and_grad,
+            initial_weights,
+            jac=True,
+            method="SLSQP",
+            bounds=bounds,
+            constraints=constraints,
+            options={"ftol": 1e-8, "maxiter": 1000},
+        )
+
+        if not result.success:
+            raise RuntimeError(f"Portfolio optimization failed: {result.message}")
+
+        return result.x
+
     def _calculate_covariance(self, returns: pd.DataFrame) -> np.ndarray:
-        """Calculate covariance matrix using specified method."""
-        if self.covariance_method == "ledoit_wolf" and SKLEARN_AVAILABLE:
+        """Calculate covariance matrix, reusing cached or supplied estimates."""
+        n_assets = len(returns.columns)
+        if self.covariance_matrix is not None:
+            cov_matrix = np.asarray(self.covariance_matrix, dtype=np.float64)
+            if cov_matrix.shape != (n_assets, n_assets):
+                raise ValueError(
+                    f"covariance_matrix must be {n_assets}x{n_assets}, "
+                    f"got {cov_matrix.shape}"
+                )
+            return cov_matrix
+
+        values = np.ascontiguousarray(returns.to_numpy(dtype=np.float64))
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.covariance_method.encode())
+        digest.update(np.asarray(values.shape).tobytes())
+        digest.update(values.tobytes())
+        key = digest.digest()
+
+        cov_matrix = _COVARIANCE_CACHE.get(key)
+        if cov_matrix is not None:
+            _COVARIANCE_CACHE.move_to_end(key)
+            return cov_matrix
+
+        cov_matrix = self._estimate_covariance(returns)
+        # Shared between jobs, so guard against in-place modification
+        cov_matrix.setflags(write=False)
+        _COVARIANCE_CACHE[key] = cov_matrix
+        if len(_COVARIANCE_CACHE) > _COVARIANCE_CACHE_SIZE:
+            _COVARIANCE_CACHE.popitem(last=False)
+        return cov_matrix
+
+    def _estimate_covariance(self, returns: pd.DataFrame) -> np.ndarray:
+        """Estimate covariance matrix using specified method."""
+        if self.covariance_method == "ledoit_wolf_gpu" and CUPY_AVAILABLE:
+            try:
+                return _ledoit_wolf_gpu(returns.to_numpy(dtype=np.float64))
+            except Exception as e:
+                # e.g. CuPy installed but no usable GPU; use the CPU estimator
+                logger.warning(f"GPU Ledoit-Wolf failed, falling back to CPU: {e}")
+
+        if (
+            self.covariance_method in ("ledoit_wolf", "ledoit_wolf_gpu")
+            and SKLEARN_AVAILABLE
+        ):
             # Use Ledoit-Wolf shrinkage estimator
             lw = LedoitWolf()
             lw.fit(returns)
@@ -274,6 +643,127 @@ class BlackScholesPricer:
 
         return results
 
+    def price_options_batch(
+        self,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any = None,
+        sigma: Any = None,
+        option_type: Any = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Price a batch of options with fully vectorized Black-Scholes.
+
+        Args:
+            S: Underlying prices (scalar or array)
+            K: Strike prices (scalar or array)
+            T: Times to expiry in years (scalar or array)
+            r: Risk-free rates (defaults to the configured rate)
+            sigma: Volatilities (defaults to the configured volatility)
+            option_type: "call"/"put" or an array of them (defaults to the
+                configured option type)
+
+        Returns:
+            Dictionary of arrays with the broadcast shape of the inputs
+        """
+        if sigma is None:
+            sigma = self.volatility
+        if sigma is None:
+            raise ValueError("Volatility must be provided")
+
+        is_call, r, S, K, T, sigma = self._batch_inputs(option_type, r, S, K, T, sigma)
+
+        price, delta, gamma, theta, vega, rho = _black_scholes_vec(
+            S, K, T, r, sigma, is_call
+        )
+        return {
+            "option_price": price,
+            "delta": delta,
+            "gamma": gamma,
+            "theta": theta,
+            "vega": vega,
+            "rho": rho,
+        }
+
+    def implied_volatility_batch(
+        self,
+        market_prices: Any,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any = None,
+        option_type: Any = None,
+        tol: float = 1e-8,
+        max_iter: int = 50,
+    ) -> np.ndarray:
+        """
+        Solve implied volatilities for a batch of options with Newton's method.
+
+        Every option is stepped at once on the whole array; options whose
+        price is matched within ``tol`` are frozen.
+
+        Args:
+            market_prices: Observed option prices
+            S: Underlying prices
+            K: Strike prices
+            T: Times to expiry in years
+            r: Risk-free rates (defaults to the configured rate)
+            option_type: "call"/"put" or an array of them
+            tol: Absolute price tolerance
+            max_iter: Maximum Newton iterations
+
+        Returns:
+            Array of implied volatilities (NaN where Newton did not converge)
+        """
+        is_call, r, S, K, T, market_prices = self._batch_inputs(
+            option_type, r, S, K, T, market_prices
+        )
+        shape = np.broadcast_shapes(
+            is_call.shape, S.shape, K.shape, T.shape, r.shape, market_prices.shape
+        )
+        # Manaster-Koehler starting point, from which Newton's method on the
+        # Black-Scholes price converges monotonically
+        sigma = np.broadcast_to(
+            np.sqrt(2 * np.abs(np.log(S / K) + r * T) / T), shape
+        ).copy()
+        np.clip(sigma, 1e-6, 5.0, out=sigma)
+        converged = np.zeros(shape, dtype=bool)
+
+        for _ in range(max_iter):
+            price, _, _, _, vega, _ = _black_scholes_vec(S, K, T, r, sigma, is_call)
+            diff = price - market_prices
+            converged = np.abs(diff) < tol
+            if converged.all():
+                break
+            step = np.divide(
+                diff, vega, out=np.zeros(shape), where=~converged & (vega > 0)
+            )
+            sigma = np.clip(sigma - step, 1e-6, 5.0)
+
+        return np.where(converged, sigma, np.nan)
+
+    def _batch_inputs(
+        self, option_type: Any, r: Any, *arrays: Any
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Resolve batch defaults and convert inputs to float64 arrays.
+
+        Returns:
+            Tuple of (is_call, r, *arrays) as arrays
+        """
+        if option_type is None:
+            option_type = self.option_type
+        option_type = np.asarray(option_type)
+        if option_type.dtype.kind in "US":
+            is_call = np.char.lower(option_type) == "call"
+        else:
+            is_call = option_type.astype(bool)
+
+        if r is None:
+            r = self.risk_free_rate
+        return (is_call, *(np.asarray(x, dtype=np.float64) for x in (r, *arrays)))
+
     def _black_scholes(
         self, S: float, K: float, T: float, r: float, sigma: float
     ) -> Tuple[float, float, float, float, float, float]:
@@ -290,36 +780,14 @@ class BlackScholesPricer:
         Returns:
             Tuple of (price, delta, gamma, theta, vega, rho)
         """
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
-
-        if self.option_type == "call":
-            price = S * stats.norm.cdf(d1) - K * np.exp(-r * T) * stats.norm.cdf(d2)
-            delta = stats.norm.cdf(d1)
-        else:  # put
-            price = K * np.exp(-r * T) * stats.norm.cdf(-d2) - S * stats.norm.cdf(-d1)
-            delta = stats.norm.cdf(d1) - 1
-
-        # Greeks
-        gamma = stats.norm.pdf(d1) / (S * sigma * np.sqrt(T))
-
-        if self.option_type == "call":
-            theta = -S * stats.norm.pdf(d1) * sigma / (2 * np.sqrt(T)) - r * K * np.exp(
-                -r * T
-            ) * stats.norm.cdf(d2)
-        else:  # put
-            theta = -S * stats.norm.pdf(d1) * sigma / (2 * np.sqrt(T)) + r * K * np.exp(
-                -r * T
-            ) * stats.norm.cdf(-d2)
-
-        vega = S * np.sqrt(T) * stats.norm.pdf(d1)
-
-        if self.option_type == "call":
-            rho = K * T * np.exp(-r * T) * stats.norm.cdf(d2)
-        else:  # put
-            rho = -K * T * np.exp(-r * T) * stats.norm.cdf(-d2)
-
-        return price, delta, gamma, theta, vega, rho
+        return _bs_kernel(
+            float(S),
+            float(K),
+            float(T),
+            float(r),
+            float(sigma),
+            self.option_type == "call",
+        )
 
 
 class BacktestEngine:
@@ -346,18 +814,15 @@ class BacktestEngine:
         """
         if weights is None:
             # Equal weight portfolio
-            weights = np.array([1.0 / len(prices.columns)] * len(prices.columns))
+            weights = np.full(len(prices.columns), 1.0 / len(prices.columns))
+        else:
+            weights = np.asarray(weights, dtype=np.float64)
 
         # Calculate returns
         returns = prices.pct_change().dropna()
 
-        # Initialize portfolio
-        portfolio_values = []
-        portfolio_weights = [weights.copy()]
-
         # Initial portfolio value
         initial_value = 1.0
-        current_value = initial_value
 
         # Rebalancing dates
         if self.rebalance_frequency == "monthly":
@@ -367,39 +832,33 @@ class BacktestEngine:
         else:
             rebalance_dates = returns.index
 
-        # Run backtest
-        for i, date in enumerate(returns.index):
-            # Calculate daily returns
-            daily_returns = returns.loc[date]
-
-            # Update portfolio value
-            current_value *= 1 + np.sum(weights * daily_returns)
-            portfolio_values.append(current_value)
-
-            # Rebalance if needed
-            if date in rebalance_dates:
-                # Apply transaction costs
-                current_value *= 1 - self.transaction_costs
+        # Run backtest: daily portfolio returns in one matrix-vector product,
+        # with transaction costs charged at the close of each rebalancing day
+        portfolio_daily = returns.to_numpy(dtype=np.float64) @ weights
+        cost_factors = np.where(
+            returns.index.isin(rebalance_dates), 1 - self.transaction_costs, 1.0
+        )
+        growth = (1 + portfolio_daily) * cost_factors
+        values_after_costs = initial_value * np.cumprod(growth)
+        current_value = float(values_after_costs[-1]) if len(growth) else initial_value
 
-                # Update weights (for now, keep same weights)
-                # In a real implementation, this would update based on strategy
-                portfolio_weights.append(weights.copy())
+        # Recorded values are before that day's rebalancing costs
+        values = values_after_costs / cost_factors
 
         # Calculate metrics
         total_return = (current_value - initial_value) / initial_value
         annualized_return = (1 + total_return) ** (252 / len(returns)) - 1
 
-        # Calculate volatility
-        portfolio_returns = pd.Series(portfolio_values).pct_change().dropna()
-        volatility = portfolio_returns.std() * np.sqrt(252)
+        # Calculate volatility (sample std of the day-over-day value changes)
+        portfolio_returns = np.diff(values) / values[:-1]
+        volatility = portfolio_returns.std(ddof=1) * np.sqrt(252)
 
         # Calculate Sharpe ratio
         sharpe_ratio = annualized_return / volatility if volatility > 0 else 0
 
         # Calculate maximum drawdown
-        cumulative_values = pd.Series(portfolio_values)
-        running_max = cumulative_values.expanding().max()
-        drawdown = (cumulative_values - running_max) / running_max
+        running_max = np.maximum.accumulate(values)
+        drawdown = (values - running_max) / running_max
         max_drawdown = drawdown.min()
 
         results = {
@@ -411,7 +870,7 @@ class BacktestEngine:
                 "max_drawdown": float(max_drawdown),
                 "final_value": float(current_value),
             },
-            "portfolio_values": portfolio_values,
+            "portfolio_values": values.tolist(),
             "rebalance_dates": [str(d) for d in rebalance_dates],
             "strategy": self.strategy,
         }
@@ -438,7 +897,7 @@ def run_model(
         from .demo_loader import generate_fixture_metrics, should_use_fixture
 
         if should_use_fixture():
-            print(f"Using fixture mode for {model_type} model")
+            logger.info(f"Using fixture mode for {model_type} model")
             # Extract symbols from params if available
             symbols = params.get("symbols", ["AAPL"])
             return generate_fixture_metrics(model_type, symbols, params)
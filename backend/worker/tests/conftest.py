@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Worker modules import each other as top-level modules (e.g. "from models
+# import run_model"), so make the worker directory importable from any rootdir
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models import BacktestEngine
+
+
+@pytest.fixture
+def prices():
+    """Three assets over six weeks of business days."""
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range("2024-01-01", periods=30)
+    returns = rng.normal(0.0005, 0.01, size=(len(index), 3))
+    return pd.DataFrame(
+        100 * np.cumprod(1 + returns, axis=0),
+        index=index,
+        columns=["AAPL", "MSFT", "GOOG"],
+    )
+
+
+def _reference_backtest(prices, weights, rebalance_dates, transaction_costs):
+    """Per-date loop: record the value, then charge costs on rebalancing days."""
+    returns = prices.pct_change().dropna()
+    value = 1.0
+    values = []
+    for date in returns.index:
+        value *= 1 + np.sum(weights * returns.loc[date].to_numpy())
+        values.append(value)
+        if date in rebalance_dates:
+            value *= 1 - transaction_costs
+    return values, value - 1.0
+
+
+@pytest.mark.parametrize("rebalance_frequency", ["daily", "weekly"])
+def test_backtest_matches_reference_loop(prices, rebalance_frequency):
+    """Test values and total return match the loop with rebalancing costs."""
+    weights = np.array([0.5, 0.3, 0.2])
+    engine = BacktestEngine(
+        {"rebalance_frequency": rebalance_frequency, "transaction_costs": 0.002}
+    )
+
+    results = engine.run_backtest(prices, weights.tolist())
+
+    rebalance_dates = pd.DatetimeIndex(results["rebalance_dates"])
+    values, total_return = _reference_backtest(prices, weights, rebalance_dates, 0.002)
+    np.testing.assert_allclose(results["portfolio_values"], values, rtol=1e-12)
+    assert results["metrics"]["total_return"] == pytest.approx(total_return, rel=1e-12)
+    assert results["metrics"]["final_value"] == pytest.approx(1 + total_return)
+
+
+def test_backtest_defaults_to_equal_weights(prices):
+    """Test omitted weights give the equal-weight portfolio."""
+    engine = BacktestEngine({"rebalance_frequency": "daily"})
+
+    results = engine.run_backtest(prices)
+
+    expected = engine.run_backtest(prices, [1 / 3] * 3)
+    assert results["portfolio_values"] == expected["portfolio_values"]
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from models import BlackScholesPricer
+
+GREEKS = ["option_price", "delta", "gamma", "theta", "vega", "rho"]
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_batch_prices_match_scalar(option_type):
+    """Test batch prices and Greeks agree with price_option per option."""
+    S = np.array([80.0, 95.0, 100.0, 105.0, 130.0])
+    sigma = np.array([0.15, 0.2, 0.25, 0.3, 0.4])
+    params = {
+        "option_type": option_type,
+        "strike_price": 100.0,
+        "time_to_expiry": 0.5,
+        "risk_free_rate": 0.03,
+    }
+    pricer = BlackScholesPricer(params)
+
+    batch = pricer.price_options_batch(S, 100.0, 0.5, sigma=sigma)
+
+    for i in range(len(S)):
+        scalar = pricer.price_option(S[i], sigma[i])["metrics"]
+        for name in GREEKS:
+            assert batch[name][i] == pytest.approx(scalar[name], rel=1e-9, abs=1e-12)
+
+
+def test_batch_mixed_option_types():
+    """Test an array of option types prices calls and puts in one call."""
+    pricer = BlackScholesPricer({"volatility": 0.2})
+
+    batch = pricer.price_options_batch(100.0, 100.0, 1.0, option_type=["call", "put"])
+
+    # Put-call parity: C - P = S - K exp(-rT)
+    call, put = batch["option_price"]
+    assert call - put == pytest.approx(100.0 - 100.0 * np.exp(-0.02))
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_implied_volatility_round_trip(option_type):
+    """Test implied vols recover the sigma used to price the options."""
+    S = np.array([90.0, 100.0, 110.0])
+    K = np.array([100.0, 100.0, 95.0])
+    T = np.array([0.25, 1.0, 2.0])
+    pricer = BlackScholesPricer({"option_type": option_type})
+    prices = pricer.price_options_batch(S, K, T, sigma=0.25)["option_price"]
+
+    implied = pricer.implied_volatility_batch(prices, S, K, T)
+
+    np.testing.assert_allclose(implied, 0.25, atol=1e-6)
+
+
+def test_implied_volatility_no_solution_is_nan():
+    """Test prices outside the no-arbitrage bounds give NaN."""
+    pricer = BlackScholesPricer({"option_type": "call"})
+
+    # Above the underlying price, and below the discounted intrinsic value
+    implied = pricer.implied_volatility_batch([120.0, 1.0], 100.0, [100.0, 80.0], 1.0)
+
+    assert np.isnan(implied).all()
+
+
+def test_implied_volatility_deep_in_the_money():
+    """Test a deep in-the-money call with real time value still round-trips."""
+    pricer = BlackScholesPricer({"option_type": "call"})
+    price = pricer.price_options_batch(200.0, 100.0, 1.0, sigma=0.6)["option_price"]
+
+    implied = pricer.implied_volatility_batch(price, 200.0, 100.0, 1.0)
+
+    assert implied == pytest.approx(0.6, abs=1e-6)
+
+
+def test_batch_requires_volatility():
+    """Test pricing without any volatility raises ValueError."""
+    with pytest.raises(ValueError):
+        BlackScholesPricer({}).price_options_batch(100.0, 100.0, 1.0)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import bq
+from bq import BigQueryLoader
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    """Loader without a BigQuery client; to_returns needs no connection."""
+    monkeypatch.setenv("GCP_PROJECT", "test-project")
+    monkeypatch.setattr(bq, "BQ_AVAILABLE", False)
+    return BigQueryLoader()
+
+
+@pytest.fixture
+def prices():
+    """Wide price frame with a gap in one symbol."""
+    index = pd.date_range("2024-01-01", periods=4, freq="D", name="ts_utc")
+    return pd.DataFrame(
+        {"AAPL": [100.0, 110.0, 99.0, 99.0], "MSFT": [50.0, 55.0, np.nan, 60.0]},
+        index=index,
+    )
+
+
+def test_to_returns_log_values(loader, prices):
+    """Test log returns equal log(P_t / P_{t-1}) and drop incomplete rows."""
+    returns = loader.to_returns(prices, method="log")
+
+    # The NaN close removes both returns that touch it
+    assert list(returns.index) == [prices.index[1]]
+    assert list(returns.columns) == ["AAPL", "MSFT"]
+    np.testing.assert_allclose(
+        returns.to_numpy(), [[np.log(110.0 / 100.0), np.log(55.0 / 50.0)]]
+    )
+
+
+def test_to_returns_simple_values(loader, prices):
+    """Test simple returns equal P_t / P_{t-1} - 1."""
+    returns = loader.to_returns(prices.drop(columns="MSFT"), method="simple")
+
+    np.testing.assert_allclose(returns["AAPL"].to_numpy(), [0.1, -0.1, 0.0])
+
+
+def test_to_returns_array_matches_frame(loader, prices):
+    """Test the array variant returns the same values as to_returns."""
+    np.testing.assert_array_equal(
+        loader.to_returns_array(prices), loader.to_returns(prices).to_numpy()
+    )
+
+
+def test_to_returns_invalid_method(loader, prices):
+    """Test an unknown method is rejected."""
+    with pytest.raises(ValueError):
+        loader.to_returns(prices, method="arithmetic")
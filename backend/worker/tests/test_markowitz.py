@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models import MarkowitzOptimizer
+
+
+@pytest.fixture
+def moments():
+    """Annualized expected returns and a positive definite covariance."""
+    mu = np.array([0.08, 0.10, 0.12, 0.07])
+    vols = np.array([0.15, 0.20, 0.25, 0.12])
+    corr = np.array(
+        [
+            [1.0, 0.3, 0.2, 0.1],
+            [0.3, 1.0, 0.4, 0.2],
+            [0.2, 0.4, 1.0, 0.3],
+            [0.1, 0.2, 0.3, 1.0],
+        ]
+    )
+    return mu, corr * np.outer(vols, vols)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"risk_aversion": 1.0},
+        {"risk_aversion": 5.0},
+        {"target_return": 0.09},
+    ],
+)
+def test_analytic_weights_match_slsqp_when_bounds_do_not_bind(moments, params):
+    """Test the closed-form optimum agrees with SLSQP inside loose bounds."""
+    mu, cov = moments
+    optimizer = MarkowitzOptimizer({**params, "min_weight": -5.0, "max_weight": 5.0})
+
+    analytic = optimizer._analytic_weights(mu, cov)
+    numeric = optimizer._solve_slsqp(mu, cov)
+
+    assert optimizer._within_bounds(analytic)
+    assert analytic.sum() == pytest.approx(1.0)
+    # SLSQP stops within its ftol of the optimum; the closed form is exact,
+    # so it is never worse on the objective
+    np.testing.assert_allclose(analytic, numeric, atol=1e-3)
+    objective = lambda w: w @ cov @ w - optimizer.risk_aversion * (mu @ w)
+    assert objective(analytic) <= objective(numeric) + 1e-12
+    if "target_return" in params:
+        assert mu @ analytic == pytest.approx(params["target_return"])
+
+
+def test_binding_bounds_fall_back_to_slsqp(moments):
+    """Test weights respect max_weight when the analytic optimum exceeds it."""
+    mu, cov = moments
+    optimizer = MarkowitzOptimizer({"risk_aversion": 5.0, "max_weight": 0.3})
+
+    assert not optimizer._within_bounds(optimizer._analytic_weights(mu, cov))
+
+    weights = optimizer._solve_slsqp(mu, cov, optimizer._analytic_weights(mu, cov))
+
+    assert weights.sum() == pytest.approx(1.0)
+    assert np.all(weights <= 0.3 + 1e-8)
+    assert np.all(weights >= -1e-8)
+
+
+def test_analytic_weights_singular_covariance():
+    """Test a singular covariance defers to the iterative solver."""
+    optimizer = MarkowitzOptimizer({})
+    cov = np.ones((3, 3))
+
+    assert optimizer._analytic_weights(np.array([0.1, 0.1, 0.1]), cov) is None
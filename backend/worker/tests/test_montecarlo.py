@@ -0,0 +1,97 @@
+import warnings
+
+import numpy as np
+import pytest
+
+import models
+from models import MonteCarloGBM
+
+RNG_METHODS = ["pseudo", "antithetic", "sobol"]
+
+
+def _drift_and_vol(mu, sigma, time_steps):
+    """Per-step log drift and volatility over one year, as in simulate()."""
+    dt = 1 / time_steps
+    return (mu - 0.5 * sigma**2) * dt, sigma * np.sqrt(dt)
+
+
+def test_antithetic_shocks_are_mirrored():
+    """Test the second half of the antithetic shocks negates the first."""
+    simulator = MonteCarloGBM(
+        {"simulations": 11, "time_steps": 5, "rng_method": "antithetic"}
+    )
+
+    shocks = simulator._draw_shocks()
+
+    n_draw = 6
+    assert shocks.shape == (5, 11)
+    np.testing.assert_array_equal(shocks[:, n_draw:], -shocks[:, : 11 - n_draw])
+
+
+def test_sobol_draws_power_of_two_batches(monkeypatch):
+    """Test Sobol points are drawn in power-of-two batches without warnings."""
+    batch_sizes = []
+
+    class RecordingSobol(models.stats.qmc.Sobol):
+        def random(self, n=1, *args, **kwargs):
+            batch_sizes.append(n)
+            return super().random(n, *args, **kwargs)
+
+    monkeypatch.setattr(models.stats.qmc, "Sobol", RecordingSobol)
+    simulator = MonteCarloGBM(
+        {"simulations": 10000, "time_steps": 4, "rng_method": "sobol"}
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        shocks = simulator._draw_shocks()
+
+    assert batch_sizes == [8192]
+    assert shocks.shape == (4, 10000)
+    np.testing.assert_array_equal(shocks[:, 5000:], -shocks[:, :5000])
+
+
+def test_unknown_rng_method_rejected():
+    """Test an unknown rng_method raises ValueError."""
+    with pytest.raises(ValueError):
+        MonteCarloGBM({"rng_method": "halton"})
+
+
+@pytest.mark.parametrize("rng_method", RNG_METHODS)
+def test_fixed_seed_is_reproducible(rng_method):
+    """Test the same seed gives identical paths and another seed does not."""
+    drift, vol = _drift_and_vol(0.08, 0.2, 12)
+
+    def run(seed):
+        simulator = MonteCarloGBM(
+            {
+                "simulations": 64,
+                "time_steps": 12,
+                "seed": seed,
+                "rng_method": rng_method,
+                "return_paths": True,
+            }
+        )
+        return simulator._simulate_paths(drift, vol)
+
+    finals, paths = run(7)
+    finals_again, paths_again = run(7)
+
+    np.testing.assert_array_equal(finals, finals_again)
+    np.testing.assert_array_equal(paths, paths_again)
+    assert not np.array_equal(finals, run(8)[0])
+
+
+@pytest.mark.parametrize("rng_method", RNG_METHODS)
+def test_terminal_mean_matches_gbm(rng_method):
+    """Test the mean terminal value is close to S0 * exp(mu * T)."""
+    mu, sigma, time_steps = 0.08, 0.2, 52
+    simulator = MonteCarloGBM(
+        {"simulations": 20000, "time_steps": time_steps, "rng_method": rng_method}
+    )
+
+    finals, paths = simulator._simulate_paths(*_drift_and_vol(mu, sigma, time_steps))
+
+    assert paths is None
+    # S0 = 1 and T = 1; the standard error is about 0.0015
+    assert finals.mean() == pytest.approx(np.exp(mu), rel=1e-2)